@@ -24,6 +24,8 @@ See Also
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 __all__: list[str] = [
     "RatingScaleInputError",
     "RatingValidationError",
@@ -57,10 +59,12 @@ class RatingScaleInputError(ValueError):
 
     >>> try:
     ...     # Code that validates rating scale input
-    ...     if not valid_input:
+    ...     rating_grades = ["A", "B", "A"]
+    ...     if len(set(rating_grades)) != len(rating_grades):
     ...         raise RatingScaleInputError("Rating grades must be unique")
     ... except RatingScaleInputError as e:
     ...     print(f"Input validation failed: {e}")
+    Input validation failed: Rating grades must be unique
     """
 
 
@@ -118,8 +122,9 @@ class RatingScaleError(KeyError):
         Human readable string describing the mapping error.
     rating : str or int, optional
         The specific rating that caused the mapping error, if applicable.
-    available_ratings : list, optional
-        List of available ratings in the scale, if applicable.
+    available_ratings : Sequence, optional
+        Available ratings in the scale, if applicable. Stored as a tuple; a
+        tuple is stored as is, so callers can share one without copying it.
     *args : tuple
         Variable length argument list passed to the base KeyError.
     **kwargs : dict
@@ -131,21 +136,23 @@ class RatingScaleError(KeyError):
     ...                      rating='X', available_ratings=['A', 'B', 'C'])
     Traceback (most recent call last):
         ...
-    credit_risk_rating.exceptions.RatingScaleError: Rating 'X' not found in scale
+    credit_risk_rating.exceptions.RatingScaleError: "Rating 'X' not found in scale"
     """
 
     def __init__(
         self,
         message: str,
         rating: str | int | None = None,
-        available_ratings: list | None = None,
+        available_ratings: Sequence | None = None,
         *args,
         **kwargs,
     ) -> None:
         """Initialize RatingScaleError with optional context."""
         super().__init__(message, *args, **kwargs)
         self.rating = rating
-        self.available_ratings = available_ratings or []
+        self.available_ratings = (
+            tuple(available_ratings) if available_ratings is not None else ()
+        )
 
 
 class MetadataError(ValueError):
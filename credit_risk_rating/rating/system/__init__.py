@@ -65,10 +65,10 @@ Examples
 ... )
 
 >>> # Two-dimensional system
->>> from credit_risk_rating.rating.systems import FCSRatingSystem
+>>> from credit_risk_rating.rating.system import FCSRatingSystem
 >>> fcs = FCSRatingSystem(
-...     pd_rating_scale={1: 0.001, 2: 0.002, ..., 14: 0.800},
-...     lgd_rating_scale={"A": 0.10, "B": 0.20, ..., "F": 0.90},
+...     pd_rating_scale={grade: grade / 100 for grade in range(1, 15)},
+...     lgd_rating_scale=dict(zip("ABCDEF", [0.10, 0.20, 0.35, 0.50, 0.70, 0.90])),
 ...     metadata={
 ...         "institution": "Farm Credit East",
 ...         "model_version": "2.1.0",
@@ -23,12 +23,22 @@ credit_risk_rating.rating.system._predefined : Pre-built industry standard syste
 
 from __future__ import annotations
 
-import json
+import sys
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Mapping
+from functools import cache
+from types import MappingProxyType
 from typing import Any, TypedDict
+from weakref import WeakValueDictionary
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is not installed
+    np = None
 
 from credit_risk_rating.exceptions import RatingScaleInputError, RatingValidationError
 from credit_risk_rating.rating.system._mappings import Metadata, RatingGrade
+from credit_risk_rating.rating.system._serialization import dumps_json
 
 __all__: list[str] = [
     "RatingSystemConfig",
@@ -75,7 +85,7 @@ class RatingSystemConfig(TypedDict, total=False):
     reference_url: str
 
 
-class TwoDimensionsalRatingSystemConfig(TypedDict, total=False):
+class PDLGDRatingSystemConfig(TypedDict, total=False):
     """Configuration dictionary for two-dimensional PD/LGD rating systems.
 
     This TypedDict defines the structure for configuring two-dimensional rating
@@ -115,6 +125,188 @@ class TwoDimensionsalRatingSystemConfig(TypedDict, total=False):
     reference_url: str
 
 
+@cache
+def _empty_metadata() -> Metadata:
+    """Return the shared empty Metadata instance.
+
+    Metadata is immutable, so every rating system constructed without metadata
+    can share a single empty instance instead of allocating a new one.
+    """
+    return Metadata()
+
+
+def _normalize_config(
+    config: RatingSystemConfig | PDLGDRatingSystemConfig,
+) -> RatingSystemConfig | PDLGDRatingSystemConfig:
+    """Return a read-only copy of a rating system configuration.
+
+    Parameters
+    ----------
+    config : RatingSystemConfig | PDLGDRatingSystemConfig
+        Class configuration dictionary to normalize
+
+    Returns
+    -------
+    RatingSystemConfig | PDLGDRatingSystemConfig
+        Copy of `config` with ``required_metadata`` and the required grades
+        stored as tuples, string metadata fields and rating grades interned,
+        and any other nested lists and mappings converted to tuples and
+        read-only mappings
+
+    Notes
+    -----
+    Configurations built from JSON or CSV data hold non-interned strings.
+    Interning them once here lets dictionary and set lookups against the
+    required fields and grades short-circuit on identity. Freezing the nested
+    values lets the class share the configuration through `get_config`
+    without it being modified in place.
+    """
+    normalized = dict(config)
+    if "required_metadata" in normalized:
+        normalized["required_metadata"] = _intern_strings(
+            normalized["required_metadata"] or ()
+        )
+    if "required_grades" in normalized:
+        normalized["required_grades"] = _intern_strings(normalized["required_grades"])
+    if "required_grade_dimensions" in normalized:
+        normalized["required_grade_dimensions"] = {
+            sys.intern(dimension): _intern_strings(grades)
+            for dimension, grades in normalized["required_grade_dimensions"].items()
+        }
+    return {key: _read_only_value(value) for key, value in normalized.items()}
+
+
+def _read_only_value(value: Any) -> Any:
+    """Convert nested lists and mappings of a configuration to read-only types.
+
+    Parameters
+    ----------
+    value : Any
+        Value held by a configuration dictionary
+
+    Returns
+    -------
+    Any
+        `value` with lists converted to tuples and mappings converted to
+        read-only ``MappingProxyType`` views, recursively
+    """
+    if isinstance(value, Mapping):
+        return MappingProxyType(
+            {key: _read_only_value(item) for key, item in value.items()}
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_read_only_value(item) for item in value)
+    return value
+
+
+def _config_to_dict(config: Mapping[str, Any]) -> dict[str, Any]:
+    """Copy a read-only configuration into plain dictionaries.
+
+    Parameters
+    ----------
+    config : Mapping[str, Any]
+        Normalized class configuration
+
+    Returns
+    -------
+    dict[str, Any]
+        New dictionary with nested mappings copied into new dictionaries, so
+        that it can be modified or serialized to JSON
+    """
+    return {
+        key: _config_to_dict(value) if isinstance(value, Mapping) else value
+        for key, value in config.items()
+    }
+
+
+def _intern_strings(values: Iterable[Any]) -> tuple[Any, ...]:
+    """Intern the string elements of an iterable, leaving other values as is.
+
+    Parameters
+    ----------
+    values : Iterable[Any]
+        Values to process
+
+    Returns
+    -------
+    tuple[Any, ...]
+        Values with string elements replaced by their interned equivalents
+    """
+    return tuple(sys.intern(value) if type(value) is str else value for value in values)
+
+
+def _require_numpy() -> None:
+    """Raise an informative error if the optional ``numpy`` package is missing.
+
+    Raises
+    ------
+    ImportError
+        If ``numpy`` is not installed
+    """
+    if np is None:
+        raise ImportError(
+            "Array based rating lookups require the optional 'numpy' package. "
+            "Install it with `pip install numpy`."
+        )
+
+
+def _read_only_array(values: Iterable[float]) -> np.ndarray:
+    """Copy rating values into a read-only float array.
+
+    Parameters
+    ----------
+    values : Iterable[float]
+        Rating values to copy
+
+    Returns
+    -------
+    np.ndarray
+        Contiguous float64 array of `values` that cannot be written to, so it
+        can be cached and handed out without copying
+
+    Raises
+    ------
+    ImportError
+        If ``numpy`` is not installed
+    """
+    _require_numpy()
+    array = np.fromiter(values, dtype=np.float64)
+    array.flags.writeable = False
+    return array
+
+
+def _freeze_config(value: Any) -> Any:
+    """Convert a configuration into a hashable equivalent.
+
+    Parameters
+    ----------
+    value : Any
+        Configuration dictionary, or a value nested within one
+
+    Returns
+    -------
+    Any
+        `value` with mappings converted to tuples of key-value pairs and lists
+        converted to tuples, recursively. Ordering is preserved, since the
+        order of the required grades is part of a rating system's definition.
+    """
+    if isinstance(value, Mapping):
+        return tuple((key, _freeze_config(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_config(item) for item in value)
+    return value
+
+
+# Classes built by the create_custom_class factories, keyed by the base class,
+# class name and frozen configuration. Entries are dropped once nothing else
+# references the class, so generating many configurations does not leak classes
+_CUSTOM_CLASS_CACHE: WeakValueDictionary[tuple[Any, ...], type] = WeakValueDictionary()
+
+
+# Shared read-only view returned for classes without a configuration
+_EMPTY_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+
 class BaseRatingSystem(ABC):
     """Abstract base class for all rating systems.
 
@@ -135,14 +327,49 @@ class BaseRatingSystem(ABC):
     metadata : Metadata
         Immutable metadata container for the rating system
 
+    Notes
+    -----
+    Rating systems are immutable: their attributes are set once during
+    construction and assigning or deleting them raises AttributeError. This
+    keeps the values cached on an instance (e.g. its hash and JSON exports)
+    consistent with its data. Create a new instance to change a rating system.
+
     Examples
     --------
     This is an abstract class and cannot be instantiated directly.
     See OneDimensionalRatingSystem or PDLGDRatingSystem for concrete examples.
     """
 
-    # Subclasses should override this with their configuration
-    _CONFIG: RatingSystemConfig | TwoDimensionsalRatingSystemConfig = {}
+    __slots__ = ("metadata", "_json_cache")
+
+    # Subclasses should override this with their configuration. It is replaced
+    # by a read-only view of the normalized configuration in __init_subclass__
+    _CONFIG: Mapping[str, Any] = _EMPTY_CONFIG
+
+    # Derived from _CONFIG once per class in __init_subclass__
+    _REQUIRED_METADATA: frozenset[str] = frozenset()
+    _CONFIG_VIEW: Mapping[str, Any] = _EMPTY_CONFIG
+
+    # Rating systems are immutable, so JSON exports are cached per indent level.
+    # Subclasses whose instances can change after construction should opt out
+    _CACHE_JSON: bool = True
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute class-level lookups derived from the class configuration.
+
+        The configuration is normalized so ``required_metadata`` is held as a
+        tuple, and the required metadata fields are frozen into a set once per
+        class so that instance construction does not need to consult
+        ``_CONFIG``. ``_CONFIG`` itself is replaced by a read-only view of the
+        normalized configuration, which ``get_config`` returns without
+        copying.
+        """
+        super().__init_subclass__(**kwargs)
+        config = _normalize_config(cls._CONFIG or {})
+        cls._CONFIG = cls._CONFIG_VIEW = (
+            MappingProxyType(config) if config else _EMPTY_CONFIG
+        )
+        cls._REQUIRED_METADATA = frozenset(config.get("required_metadata", ()))
 
     def __init__(self, metadata: dict[str, Any] | Metadata | None = None):
         """Initialize the base rating system.
@@ -152,9 +379,127 @@ class BaseRatingSystem(ABC):
         metadata : dict[str, Any] | Metadata | None, optional
             Metadata about the rating system, by default None
         """
-        self.metadata = self._process_metadata_input(metadata)
+        object.__setattr__(self, "metadata", self._process_metadata_input(metadata))
         self._validate_required_metadata()
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Prevent modification after initialization (immutable)."""
+        # Initialization and caches write through object.__setattr__ directly
+        raise AttributeError(
+            f"{self.__class__.__name__} objects are immutable. "
+            "Create a new rating system instead."
+        )
+
+    def __delattr__(self, name: str) -> None:
+        """Prevent attribute deletion (immutable)."""
+        raise AttributeError(
+            f"{self.__class__.__name__} objects are immutable. "
+            "Create a new rating system instead."
+        )
+
+    @classmethod
+    def _unchecked_new(cls, metadata: Metadata):
+        """Create an instance from already validated metadata.
+
+        Bypasses `_process_metadata_input` and `_validate_required_metadata`
+        for internal callers (e.g. deserializers and factories) that already
+        hold a `Metadata` instance known to satisfy the class requirements.
+        Subclasses are responsible for setting any remaining attributes.
+
+        Parameters
+        ----------
+        metadata : Metadata
+            Validated metadata for the rating system
+
+        Returns
+        -------
+        BaseRatingSystem
+            New instance of the class with only `metadata` set
+        """
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "metadata", metadata)
+        return instance
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Mapping[str, Any]],
+        shared_metadata: dict[str, Any] | Metadata | None = None,
+    ) -> list[BaseRatingSystem]:
+        """Create many rating systems that share the same metadata.
+
+        The shared metadata is processed and validated against the class
+        requirements once, and the resulting `Metadata` instance is reused by
+        every rating system in the batch. Rating scales are still processed and
+        validated for each record.
+
+        Parameters
+        ----------
+        records : Iterable[Mapping[str, Any]]
+            Rating scale keyword arguments for each rating system, e.g.
+            ``{"rating_scale": {...}}`` for one-dimensional systems or
+            ``{"pd_rating_scale": {...}, "lgd_rating_scale": {...}}`` for
+            PD/LGD systems
+        shared_metadata : dict[str, Any] | Metadata | None, optional
+            Metadata shared by all rating systems, by default None
+
+        Returns
+        -------
+        list[BaseRatingSystem]
+            Rating systems in the same order as `records`
+
+        Raises
+        ------
+        RatingValidationError
+            If the shared metadata or a record's rating scale fails validation
+
+        Examples
+        --------
+        >>> from credit_risk_rating.rating.system._predefined import (
+        ...     UniformClassificationSystem,
+        ... )
+        >>> grades = UniformClassificationSystem.get_config()["required_grades"]
+        >>> portfolio_scales = [
+        ...     dict(zip(grades, [0.01, 0.05, 0.20, 0.50, 1.0])),
+        ...     dict(zip(grades, [0.02, 0.08, 0.25, 0.60, 1.0])),
+        ... ]
+        >>> systems = UniformClassificationSystem.from_records(
+        ...     [{"rating_scale": scale} for scale in portfolio_scales],
+        ...     shared_metadata={
+        ...         "institution": "ABC Bank",
+        ...         "examination_date": "2024-01-01",
+        ...     },
+        ... )
+        >>> len(systems)
+        2
+        >>> systems[0].metadata is systems[1].metadata
+        True
+        """
+        validator = cls.__new__(cls)
+        metadata = validator._process_metadata_input(shared_metadata)
+        object.__setattr__(validator, "metadata", metadata)
+        validator._validate_required_metadata()
+
+        systems = []
+        for record in records:
+            system = cls._unchecked_new(metadata)
+            system._init_rating_scales(**record)
+            systems.append(system)
+        return systems
+
+    def _init_rating_scales(self, **rating_scales: Any) -> None:
+        """Process and validate the rating scales of a new instance.
+
+        Concrete rating systems implement this to set their rating scale
+        attributes so that `__init__` and `from_records` share the same logic.
+
+        Parameters
+        ----------
+        **rating_scales : Any
+            Rating scale inputs keyed by constructor argument name
+        """
+        raise NotImplementedError
+
     def _process_metadata_input(
         self, metadata: dict[str, Any] | Metadata | None
     ) -> Metadata:
@@ -178,46 +523,66 @@ class BaseRatingSystem(ABC):
         RatingScaleInputError
             If metadata input is invalid type
         """
-        if isinstance(metadata, Metadata):
+        # Order checks by frequency, using exact type checks before isinstance
+        if metadata is None:
+            return _empty_metadata()
+
+        metadata_type = type(metadata)
+        if metadata_type is Metadata:
+            return metadata
+        elif metadata_type is dict:
+            return Metadata.from_dict(metadata)
+        # Fall back to isinstance for subclasses of Metadata or dict
+        elif isinstance(metadata, Metadata):
             return metadata
-        elif isinstance(metadata, dict) or metadata is None:
+        elif isinstance(metadata, dict):
             return Metadata.from_dict(metadata)
         else:
             raise RatingScaleInputError(
                 f"Expected metadata parameter to have type dict or Metadata. "
-                f"Found type {type(metadata)} instead."
+                f"Found type {metadata_type} instead."
             )
 
+    def _missing_required_metadata(self) -> frozenset[str]:
+        """Get the required metadata fields missing from the instance metadata.
+
+        This is the cheap check behind `_validate_required_metadata`. Bulk
+        validation code can call it directly to collect missing fields without
+        the cost of formatting an error message for each instance.
+
+        Returns
+        -------
+        frozenset[str]
+            Required metadata fields that are not present (empty if valid)
+        """
+        return self._REQUIRED_METADATA.difference(self.metadata)
+
     def _validate_required_metadata(self) -> None:
         """Validate that all required metadata fields are present.
 
-        Checks the class configuration to determine required metadata fields
-        and validates that all required fields are present in the instance
-        metadata.
+        Uses the required metadata fields precomputed from the class
+        configuration and validates that all required fields are present in
+        the instance metadata.
 
         Raises
         ------
         RatingValidationError
             If required metadata fields are missing
         """
-        if not hasattr(self, "_CONFIG") or not self._CONFIG:
-            return None  # No requirements to validate
-
-        required_metadata = self._CONFIG.get("required_metadata", [])
-        if not required_metadata:
-            return None  # No metadata requirements
-
-        missing_metadata = [
-            field for field in required_metadata if field not in self.metadata
-        ]
-
-        if missing_metadata:
-            available_metadata = list(self.metadata.keys())
-            raise RatingValidationError(
-                f"Missing required metadata fields: {missing_metadata}. "
-                f"Required: {required_metadata}. "
-                f"Available: {available_metadata}"
-            )
+        # Single superset check against the underlying key view on the hot path
+        if self.metadata.as_view().keys() >= self._REQUIRED_METADATA:
+            return None
+
+        # Only work out what is missing once validation has actually failed
+        missing_metadata = self._missing_required_metadata()
+        raise RatingValidationError(
+            "Missing required metadata fields: "
+            + ", ".join(sorted(missing_metadata))
+            + ". Required: "
+            + ", ".join(sorted(self._REQUIRED_METADATA))
+            + ". Available: "
+            + ", ".join(map(str, self.metadata.keys()))
+        )
 
     @abstractmethod
     def get_rating_grades(self) -> list[RatingGrade] | dict[str, list[RatingGrade]]:
@@ -232,7 +597,7 @@ class BaseRatingSystem(ABC):
             For one-dimensional systems, returns list of grades.
             For multi-dimensional systems, returns dict with dimension names as keys.
         """
-        pass
+        raise NotImplementedError
 
     @abstractmethod
     def to_dict(self) -> dict[str, Any]:
@@ -247,7 +612,7 @@ class BaseRatingSystem(ABC):
         dict[str, Any]
             Dictionary representation of the rating system
         """
-        pass
+        raise NotImplementedError
 
     def to_json(self, indent: int = 2) -> str:
         """Export rating system to JSON string.
@@ -256,6 +621,9 @@ class BaseRatingSystem(ABC):
         the to_dict() method. The resulting JSON can be used for storage,
         transmission, or reconstruction of the rating system.
 
+        The result is cached on the instance for each `indent` value, unless
+        the class sets ``_CACHE_JSON = False``.
+
         Parameters
         ----------
         indent : int, default=2
@@ -268,28 +636,50 @@ class BaseRatingSystem(ABC):
 
         Examples
         --------
-        >>> # Assuming 'system' is a rating system instance
+        >>> from credit_risk_rating.rating.system import OneDimensionalRatingSystem
+        >>> system = OneDimensionalRatingSystem(
+        ...     rating_scale={"A": 0.01, "B": 0.05},
+        ...     metadata={"institution": "ABC Bank"},
+        ... )
         >>> json_str = system.to_json()
         >>> print(json_str)
         {
-          "rating_system_type": "MyRatingSystem",
-          "metadata": {...},
-          ...
+          "rating_system_type": "OneDimensionalRatingSystem",
+          "rating_scale": {
+            "A": 0.01,
+            "B": 0.05
+          },
+          "metadata": {
+            "institution": "ABC Bank"
+          },
+          "config": {}
         }
         """
-        return json.dumps(self.to_dict(), indent=indent)
+        if not self._CACHE_JSON:
+            return dumps_json(self.to_dict(), indent=indent)
+
+        cache = getattr(self, "_json_cache", None)
+        if cache is None:
+            cache = {}
+            object.__setattr__(self, "_json_cache", cache)
+        json_str = cache.get(indent)
+        if json_str is None:
+            json_str = cache[indent] = dumps_json(self.to_dict(), indent=indent)
+        return json_str
 
     @classmethod
-    def get_config(cls) -> RatingSystemConfig | TwoDimensionsalRatingSystemConfig:
+    def get_config(cls) -> Mapping[str, Any]:
         """Get the configuration for this rating system class.
 
-        Returns a copy of the class configuration dictionary, which defines
-        the requirements and metadata for instances of this rating system.
+        Returns a read-only view of the class configuration dictionary, which
+        defines the requirements and metadata for instances of this rating
+        system. The view and its nested values are read-only and shared across
+        calls; use `get_config_copy` if a mutable dictionary is needed.
 
         Returns
         -------
-        RatingSystemConfig | PDLGDRatingSystemConfig
-            Configuration dictionary for this rating system
+        Mapping[str, Any]
+            Read-only view of the configuration for this rating system
 
         Examples
         --------
@@ -297,6 +687,20 @@ class BaseRatingSystem(ABC):
             UniformClassificationSystem
         >>> config = UniformClassificationSystem.get_config()
         >>> print(config['required_grades'])
-        ['Acceptable', 'Special Mention', 'Substandard', 'Doubtful', 'Loss']
+        ('Acceptable', 'Special Mention', 'Substandard', 'Doubtful', 'Loss')
+        """
+        return cls._CONFIG_VIEW
+
+    @classmethod
+    def get_config_copy(
+        cls,
+    ) -> RatingSystemConfig | PDLGDRatingSystemConfig:
+        """Get a mutable copy of the configuration for this rating system class.
+
+        Returns
+        -------
+        RatingSystemConfig | PDLGDRatingSystemConfig
+            New copy of the configuration dictionary for this rating system,
+            with nested mappings also copied into dictionaries
         """
-        return cls._CONFIG.copy() if cls._CONFIG else {}
+        return _config_to_dict(cls._CONFIG_VIEW)
@@ -18,7 +18,7 @@ Examples
 >>> # Create metadata with attribute access
 >>> metadata = Metadata({"model_version": "v2.1", "institution": "ABC Bank"})
 >>> print(metadata.model_version)
-"v2.1"
+v2.1
 
 See Also
 --------
@@ -28,11 +28,21 @@ See Also
 
 from __future__ import annotations
 
-import json
-from abc import ABC, abstractmethod
+import sys
+from collections.abc import Mapping
+from functools import cache
+from keyword import iskeyword
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Any, Generic, TypeVar, Union
 
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - exercised when msgspec is not installed
+    msgspec = None
+
 from credit_risk_rating.exceptions import MetadataError, RatingScaleError
+from credit_risk_rating.rating.system._serialization import dumps_json
 
 __all__: list[str] = ["RatingScale", "Metadata"]
 __author__: list[str] = ["RNKuhns"]
@@ -40,13 +50,79 @@ __author__: list[str] = ["RNKuhns"]
 # Type alias for rating grades
 RatingGrade = Union[int, str]
 
+# Allowed types for rating grades and values
+_GRADE_TYPES: tuple[type, ...] = (str, int)
+_GRADE_TYPE_SET: frozenset[type] = frozenset(_GRADE_TYPES)
+_VALUE_TYPE_SET: frozenset[type] = frozenset((float,))
+
 # Generic type variables for the base class
 K = TypeVar("K")  # Key type
 V = TypeVar("V")  # Value type
 
 
-class _ImmutableMapping(ABC, Generic[K, V]):
-    """Abstract base class for immutable mapping containers.
+def _get_values(data: Mapping[K, V], keys: list[K]) -> tuple[V, ...]:
+    """Look up the values for several keys in a single C-level pass.
+
+    Parameters
+    ----------
+    data : Mapping[K, V]
+        Mapping to look the keys up in
+    keys : list[K]
+        Keys to look up
+
+    Returns
+    -------
+    tuple[V, ...]
+        Values for `keys`, in the same order
+
+    Raises
+    ------
+    KeyError
+        If any of the keys are not in `data`
+    """
+    if len(keys) == 1:
+        return (data[keys[0]],)
+    elif keys:
+        return itemgetter(*keys)(data)
+    return ()
+
+
+@cache
+def _rating_scale_decoder(grade_type: type[int] | type[str]):
+    """Return the shared msgspec JSON decoder for rating scales.
+
+    Decoders compile their type schema on creation, so one is built per grade
+    type and reused for every rating scale decoded afterwards.
+
+    Parameters
+    ----------
+    grade_type : type[int] | type[str]
+        Type of the rating grades
+
+    Returns
+    -------
+    msgspec.json.Decoder
+        Decoder for a JSON object mapping `grade_type` grades to float values
+
+    Raises
+    ------
+    ImportError
+        If ``msgspec`` is not installed
+    ValueError
+        If `grade_type` is not ``int`` or ``str``
+    """
+    if msgspec is None:
+        raise ImportError(
+            "Decoding rating scales from JSON bytes requires the optional "
+            "'msgspec' package. Install it with `pip install msgspec`."
+        )
+    if grade_type not in _GRADE_TYPES:
+        raise ValueError(f"grade_type must be 'str' or 'int', got {grade_type!r}.")
+    return msgspec.json.Decoder(dict[grade_type, float])
+
+
+class _ImmutableMapping(Generic[K, V]):
+    """Base class for immutable mapping containers.
 
     This class provides common functionality for immutable dict-like containers
     that prevent modification after initialization while providing convenient
@@ -59,43 +135,176 @@ class _ImmutableMapping(ABC, Generic[K, V]):
 
     Attributes
     ----------
-    _data : dict[K, V]
-        Internal storage for the mapping data (frozen after init)
+    _data : MappingProxyType[K, V]
+        Read-only view over the internal storage for the mapping data
+    _keys : tuple[K, ...]
+        Keys of the mapping, cached at initialization
+    _values : tuple[V, ...]
+        Values of the mapping, cached at initialization
+    _items : tuple[tuple[K, V], ...]
+        Key-value pairs of the mapping, cached at initialization
+    _hash : int | None
+        Hash of the mapping data, computed on first use
+    _repr : str
+        String representation of the mapping, set on first use
     """
 
+    __slots__ = ("_data", "_keys", "_values", "_items", "_hash", "_repr")
+
+    # Instances are frozen as soon as they are created, so attribute assignment
+    # always raises and the instance does not need to track its own state
+    _frozen = True
+
+    # Messages for blocked attribute writes, built once per class in
+    # __init_subclass__ rather than formatted on every attempt
+    _setattr_message = (
+        "_ImmutableMapping objects are immutable. "
+        "Use add() or similar methods to create a new instance."
+    )
+    _delattr_message = (
+        "_ImmutableMapping objects are immutable. "
+        "Use subset or similar methods to create a new instance."
+    )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the immutability error messages for the subclass."""
+        super().__init_subclass__(**kwargs)
+        cls._setattr_message = (
+            f"{cls.__name__} objects are immutable. "
+            "Use add() or similar methods to create a new instance."
+        )
+        cls._delattr_message = (
+            f"{cls.__name__} objects are immutable. "
+            "Use subset or similar methods to create a new instance."
+        )
+
+    def __class_getitem__(cls, item: Any):
+        """Return the class itself for subscripted forms like ``RatingScale[K, V]``.
+
+        The type parameters are only used by static type checkers, which read
+        them from the ``Generic`` base. Returning the class at runtime skips
+        building a ``typing`` generic alias for every subscription.
+        """
+        return cls
+
     def __init__(self, data: dict[K, V] | None = None) -> None:
         """Initialize the immutable mapping."""
-        # Create a deep copy to prevent external mutation
-        self._data = dict(data) if data else {}
-        self._validate_data()
+        # Copy once to prevent external mutation
+        data = self._copy_data(data) if data else {}
+        self._validate_data(data)
+        self._freeze(data)
+
+    @staticmethod
+    def _copy_data(data: dict[K, V]) -> dict[K, V]:
+        """Copy input data into the dictionary the instance will own.
+
+        Subclasses can override this to normalize the data while copying it.
+
+        Parameters
+        ----------
+        data : dict[K, V]
+            Non-empty input data, either a mapping or an iterable of key-value
+            pairs
+
+        Returns
+        -------
+        dict[K, V]
+            New dictionary with the same key-value pairs
+        """
+        return dict(data)
+
+    def _freeze(self, data: dict[K, V]) -> None:
+        """Store validated data behind a read-only view and finish setup.
+
+        Parameters
+        ----------
+        data : dict[K, V]
+            Validated data. The instance takes ownership of the dictionary, so
+            callers must not keep a reference to it.
+        """
+        data = MappingProxyType(data)
+        object.__setattr__(self, "_data", data)
+        # The mapping never changes, so its views only need to be built once
+        object.__setattr__(self, "_keys", tuple(data))
+        object.__setattr__(self, "_values", tuple(data.values()))
+        object.__setattr__(self, "_items", tuple(data.items()))
+        object.__setattr__(self, "_hash", None)
         self._post_init_setup()
-        # Mark as frozen to prevent __setattr__ from working
-        object.__setattr__(self, "_frozen", True)
 
-    @abstractmethod
+    @classmethod
+    def _from_trusted(cls, data: dict[K, V]):
+        """Create instance from data that has already been validated.
+
+        Skips `_validate_data` for internal callers that only combine or subset
+        the data of existing instances.
+
+        Parameters
+        ----------
+        data : dict[K, V]
+            Validated data. The new instance takes ownership of the dictionary.
+
+        Returns
+        -------
+        _ImmutableMapping
+            New instance of the class
+        """
+        instance = cls.__new__(cls)
+        instance._freeze(data)
+        return instance
+
+    def _stored_keys(self, keys: list[K]) -> list[K]:
+        """Replace keys that were found in the mapping with the stored keys.
+
+        Lookups also match equal keys of other types (e.g. ``1.0`` or ``True``
+        for ``1``), so keys taken from a caller have not been validated.
+
+        Parameters
+        ----------
+        keys : list[K]
+            Keys that are all in the mapping
+
+        Returns
+        -------
+        list[K]
+            The mapping's own keys, in the same order as `keys`
+        """
+        if set(map(type, keys)) <= set(map(type, self._keys)):
+            # Equal keys of the same types are the same grades or items
+            return keys
+        stored_keys = dict(zip(self._keys, self._keys))
+        return [stored_keys[key] for key in keys]
+
     def _post_init_setup(self) -> None:
-        """Set attributes dynamically for dot notation access."""
-        pass
+        """Set attributes dynamically for dot notation access.
 
-    @abstractmethod
-    def _validate_data(self) -> None:
+        Subclasses must implement this.
+        """
+        raise NotImplementedError
+
+    def _validate_data(self, data: dict[K, V]) -> None:
         """Validate the data during initialization.
 
-        Subclasses should implement this to add specific validation logic.
+        Subclasses must implement this to add specific validation logic.
+
+        Parameters
+        ----------
+        data : dict[K, V]
+            Data to validate
         """
-        pass
+        raise NotImplementedError
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Prevent modification after initialization (immutable)."""
-        # Allow setting during __init__
-        if not hasattr(self, "_frozen"):
-            object.__setattr__(self, name, value)
-        else:
-            class_name = self.__class__.__name__
-            raise AttributeError(
-                f"{class_name} objects are immutable. "
-                f"Use add() or similar methods to create a new instance."
-            )
+        # Initialization writes through object.__setattr__ directly
+        raise AttributeError(self._setattr_message)
+
+    def __delattr__(self, name: str) -> None:
+        """Prevent attribute deletion (immutable)."""
+        raise AttributeError(self._delattr_message)
+
+    def __reduce__(self):
+        """Support pickling and copying by reconstructing from the data."""
+        return (self.__class__, (self._data.copy(),))
 
     def __getitem__(self, key: K) -> V:
         """Dictionary-style access."""
@@ -105,35 +314,83 @@ class _ImmutableMapping(ABC, Generic[K, V]):
         """Check if key exists."""
         return key in self._data
 
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Get the value for a key, or a default if the key is not present.
+
+        A single lookup that avoids the separate membership test and item
+        access of ``mapping[key] if key in mapping else default``.
+
+        Parameters
+        ----------
+        key : K
+            The key to look up
+        default : V | None, optional
+            Value returned if `key` is not present, by default None
+
+        Returns
+        -------
+        V | None
+            The value for `key` if present, otherwise `default`
+        """
+        return self._data.get(key, default)
+
     def __iter__(self):
         """Iterate over keys."""
-        return iter(self._data)
+        # Walk the cached key tuple rather than the proxy over the dictionary
+        return iter(self._keys)
 
     def __len__(self) -> int:
         """Number of items in the mapping."""
-        return len(self._data)
+        return len(self._keys)
 
     def __eq__(self, other) -> bool:
         """Equality comparison."""
-        if not isinstance(other, self.__class__):
+        if self is other:
+            return True
+        if type(other) is not type(self) and not isinstance(other, type(self)):
+            return NotImplemented
+        # Differing sizes or cached hashes rule out equality without comparing
+        # the data item by item
+        if len(self._data) != len(other._data):
+            return False
+        self_hash, other_hash = self._hash, other._hash
+        if self_hash is not None and other_hash is not None and self_hash != other_hash:
             return False
         return self._data == other._data
 
+    def __hash__(self) -> int:
+        """Hash of the mapping data, cached after the first call.
+
+        Raises
+        ------
+        TypeError
+            If any value in the mapping is unhashable
+        """
+        mapping_hash = self._hash
+        if mapping_hash is None:
+            mapping_hash = hash(frozenset(self._items))
+            object.__setattr__(self, "_hash", mapping_hash)
+        return mapping_hash
+
     def __repr__(self) -> str:
-        """String representation."""
-        return f"{self.__class__.__name__}({self._data})"
+        """Return the string representation, cached after the first call."""
+        mapping_repr = getattr(self, "_repr", None)
+        if mapping_repr is None:
+            mapping_repr = f"{self.__class__.__name__}({self._data.copy()})"
+            object.__setattr__(self, "_repr", mapping_repr)
+        return mapping_repr
 
     def keys(self) -> tuple[K, ...]:
         """Get all keys."""
-        return tuple(self._data.keys())
+        return self._keys
 
     def values(self) -> tuple[V, ...]:
         """Get all values."""
-        return tuple(self._data.values())
+        return self._values
 
-    def items(self) -> list[tuple[K, V]]:
+    def items(self) -> tuple[tuple[K, V], ...]:
         """Get all key-value pairs."""
-        return list(self._data.items())
+        return self._items
 
     def to_dict(self) -> dict[K, V]:
         """Convert to regular dictionary.
@@ -142,14 +399,34 @@ class _ImmutableMapping(ABC, Generic[K, V]):
         -------
         dict[K, V]
             A new dictionary with the same key-value pairs
+
+        See Also
+        --------
+        as_view : Read-only view of the data that does not copy it
         """
-        return dict(self._data)
+        # The proxy forwards copy() to the dictionary it wraps, a single C-level
+        # copy, whereas dict(proxy) rebuilds it through the generic mapping path
+        return self._data.copy()
+
+    def as_view(self) -> Mapping[K, V]:
+        """Get a read-only view of the mapping data without copying it.
+
+        Use this instead of `to_dict` when the data only needs to be read,
+        e.g. for lookups or iteration, to avoid copying the mapping.
+
+        Returns
+        -------
+        Mapping[K, V]
+            Read-only ``MappingProxyType`` view of the mapping data
+        """
+        return self._data
 
     def to_json(self, indent: int = 2) -> str:
         """Export to a JSON string.
 
-        Converts the _ImmutableMapping to a JSON string representation using
-        the to_dict() method. The resulting JSON can be used for storage,
+        Converts the _ImmutableMapping to a JSON string representation. The
+        internal data is serialized directly, without the intermediate copy
+        made by to_dict(). The resulting JSON can be used for storage,
         transmission, or reconstruction of the _ImmutableMapping.
 
         Parameters
@@ -164,16 +441,15 @@ class _ImmutableMapping(ABC, Generic[K, V]):
 
         Examples
         --------
-        >>> # Assuming 'system' is a rating system instance
-        >>> json_str = system.to_json()
+        >>> rating_scale = RatingScale({1: 0.01, 2: 0.02})
+        >>> json_str = rating_scale.to_json()
         >>> print(json_str)
         {
-          "rating_system_type": "MyRatingSystem",
-          "metadata": {...},
-          ...
+          "1": 0.01,
+          "2": 0.02
         }
         """
-        return json.dumps(self.to_dict(), indent=indent)
+        return dumps_json(self._data, indent=indent)
 
     @classmethod
     def from_dict(cls, data: dict[K, V] | None = None):
@@ -182,13 +458,16 @@ class _ImmutableMapping(ABC, Generic[K, V]):
         Parameters
         ----------
         data : dict[K, V] | None, optional
-            Data for the mapping, by default None
+            Data for the mapping, by default None. An existing instance of the
+            class is returned as is, because it is immutable and already valid.
 
         Returns
         -------
         _ImmutableMapping
-            New instance of the class
+            Instance of the class holding `data`
         """
+        if type(data) is cls:
+            return data
         return cls(data)
 
     def _add_items(self, additional_items: dict[K, V]):
@@ -210,10 +489,12 @@ class _ImmutableMapping(ABC, Generic[K, V]):
         Notes
         -----
         If keys overlap, additional_items values will override existing values.
+        Existing items were validated when this instance was created, so only
+        the additional items are validated.
         """
-        combined_data = dict(self._data)  # Copy existing
-        combined_data.update(additional_items)  # Add new data
-        return self.__class__(combined_data)
+        additional_items = self._copy_data(additional_items) if additional_items else {}
+        self._validate_data(additional_items)
+        return self._from_trusted({**self._data, **additional_items})
 
 
 class RatingScale(_ImmutableMapping[RatingGrade, float]):
@@ -255,30 +536,86 @@ class RatingScale(_ImmutableMapping[RatingGrade, float]):
     5
     """
 
+    # Rating scales store nothing beyond the base class slots
+    __slots__ = ()
+
     def __init__(self, rating_scale: dict[RatingGrade, float] | None = None) -> None:
         """Initialize rating map with optional dictionary."""
         super().__init__(rating_scale)
 
-    @abstractmethod
     def _post_init_setup(self) -> None:
-        """Set attributes dynamically for dot notation access."""
+        """Finish initialization; rating scales need no additional setup."""
         return None
 
-    def _validate_data(self) -> None:
+    @staticmethod
+    def _copy_data(data: dict[RatingGrade, float]) -> dict[RatingGrade, float]:
+        """Copy the rating scale, interning string rating grades.
+
+        Rating scales are re-created with the same grade labels many times, so
+        interning them shares one string object per label and lets grade
+        lookups short-circuit on identity.
+
+        Parameters
+        ----------
+        data : dict[RatingGrade, float]
+            Non-empty rating scale mapping
+
+        Returns
+        -------
+        dict[RatingGrade, float]
+            New rating scale mapping with interned string grades
+        """
+        if not isinstance(data, Mapping):
+            # Accept the same inputs as dict(), e.g. lists of pairs
+            data = dict(data)
+        return {
+            sys.intern(grade) if type(grade) is str else grade: value
+            for grade, value in data.items()
+        }
+
+    def _validate_data(self, data: dict[RatingGrade, float]) -> None:
         """Validate that grades are string or integer values and values are float."""
-        grade_errors, value_errors = [], []
-        for grade, value in self._data.items():
-            if not isinstance(grade, (str, int)):
-                grade_errors.append(grade)
-            if not isinstance(value, (float)):
-                value_errors.append(value)
+        # Collect the distinct exact types in C and compare them as sets, so
+        # well-formed scales never enumerate items at the Python level
+        if (
+            set(map(type, data)) <= _GRADE_TYPE_SET
+            and set(map(type, data.values())) <= _VALUE_TYPE_SET
+        ):
+            return None
+        self._check_data_types(data)
+
+    @staticmethod
+    def _check_data_types(data: dict[RatingGrade, float]) -> None:
+        """Classify invalid rating grades and values and raise if any are found.
+
+        This is the slow path of `_validate_data`. It uses ``isinstance`` so
+        that subclasses of the allowed types (e.g. ``numpy.float64``) are
+        still accepted.
 
+        Parameters
+        ----------
+        data : dict[RatingGrade, float]
+            Rating scale data to check
+
+        Raises
+        ------
+        TypeError
+            If any rating grade is not a str or int, or any rating value is
+            not a float
+        """
+        grade_errors = [grade for grade in data if not isinstance(grade, _GRADE_TYPES)]
+        value_errors = [
+            f"{grade!r}: {value!r}"
+            for grade, value in data.items()
+            if not isinstance(value, float)
+        ]
         if grade_errors or value_errors:
             raise TypeError(
                 "Error in rating grades or values.\n"
-                "Grades must be str or int and values must be float.\n"
-                f"Rating grade errors: {', '.join([grade_errors])}.\n",
-                f"Rating value errors: {', '.join([value_errors])}.",
+                "Rating grades must be 'str' or 'int' and rating values must be "
+                "numeric (float).\n"
+                f"Rating grade errors: {', '.join(map(repr, grade_errors))}.\n"
+                f"Rating value errors: {', '.join(value_errors)}."
             )
 
     @property
@@ -290,35 +627,35 @@ class RatingScale(_ImmutableMapping[RatingGrade, float]):
         dict[RatingGrade, float]
             A copy of the internal rating scale mapping
         """
-        return dict(self._data)
+        return self._data.copy()
 
-    def rating_grades(self) -> tuple[RatingGrade]:
+    def rating_grades(self) -> tuple[RatingGrade, ...]:
         """Get all rating grades.
 
         Returns
         -------
-        list[RatingGrade]
-            List of all rating grades in the mapping
+        tuple[RatingGrade, ...]
+            Tuple of all rating grades in the mapping
         """
         return self.keys()
 
-    def rating_values(self) -> tuple[float]:
+    def rating_values(self) -> tuple[float, ...]:
         """Get all rating values.
 
         Returns
         -------
-        list[float]
-            List of all rating values in the mapping
+        tuple[float, ...]
+            Tuple of all rating values in the mapping
         """
         return self.values()
 
-    def rating_grade_value_pairs(self) -> list[tuple[RatingGrade, float]]:
+    def rating_grade_value_pairs(self) -> tuple[tuple[RatingGrade, float], ...]:
         """Get all grade-value pairs.
 
         Returns
         -------
-        list[tuple[RatingGrade, float]]
-            List of (grade, value) tuples
+        tuple[tuple[RatingGrade, float], ...]
+            Tuple of (grade, value) tuples
         """
         return self.items()
 
@@ -340,6 +677,62 @@ class RatingScale(_ImmutableMapping[RatingGrade, float]):
         """
         return super().from_dict(rating_scale)
 
+    @classmethod
+    def from_json_bytes(
+        cls, data: bytes | str, grade_type: type[int] | type[str] = str
+    ) -> RatingScale:
+        """Create RatingScale directly from a JSON object.
+
+        Uses the optional ``msgspec`` package to parse and type check the JSON
+        in a single pass, skipping the Python-level validation done for
+        dictionaries. This is intended for pipelines that load many rating
+        scales from JSON, e.g. calibration data feeds. ``msgspec`` is installed
+        with the ``test`` extra, or separately with ``pip install msgspec``.
+
+        Parameters
+        ----------
+        data : bytes | str
+            JSON object mapping rating grades to rating values
+        grade_type : type[int] | type[str], default=str
+            Type of the rating grades. JSON object keys are always strings, so
+            use ``int`` to decode numeric grades such as those written by
+            `to_json` for integer rating scales.
+
+        Returns
+        -------
+        RatingScale
+            New RatingScale instance
+
+        Raises
+        ------
+        ImportError
+            If ``msgspec`` is not installed
+        TypeError
+            If any rating grade cannot be decoded as `grade_type` or any rating
+            value is not numeric
+        ValueError
+            If `data` is not valid JSON
+
+        Examples
+        --------
+        >>> rating_map = RatingScale.from_json_bytes(
+        ...     b'{"1": 0.01, "2": 0.02}', grade_type=int
+        ... )
+        >>> rating_map[1]
+        0.01
+        """
+        decoder = _rating_scale_decoder(grade_type)
+        try:
+            rating_scale = decoder.decode(data)
+        except msgspec.ValidationError as error:
+            raise TypeError(
+                "Error in rating grades or values.\n"
+                f"Rating grades must be '{grade_type.__name__}' and rating values "
+                f"must be numeric (float).\n{error}"
+            ) from error
+        # Types were checked while decoding, so only the grades need interning
+        return cls._from_trusted(cls._copy_data(rating_scale))
+
     def subset_grades(self, grades: RatingGrade | list[RatingGrade]) -> RatingScale:
         """Create new RatingScale with subset of rating grades.
 
@@ -361,18 +754,21 @@ class RatingScale(_ImmutableMapping[RatingGrade, float]):
         if not isinstance(grades, list):
             grades = [grades]
 
-        # Validate all grades exist before creating subset
-        missing_grades = [grade for grade in grades if grade not in self._data]
-        if missing_grades:
-            available_grades = list(self._data.keys())
+        try:
+            subset_values = _get_values(self._data, grades)
+        except KeyError:
+            # Only work out which grades are missing once the lookup has failed
+            missing_grades = [grade for grade in grades if grade not in self._data]
             raise RatingScaleError(
-                f"Rating grades not found: {missing_grades}",
-                f"Available rating grades: {available_grades}",
-            )
+                f"Rating grades not found: {missing_grades}. "
+                f"Available rating grades: {list(self._keys)}",
+                rating=missing_grades[0],
+                # The cached key tuple is immutable, so share it rather than copy
+                available_ratings=self._keys,
+            ) from None
 
-        # Create subset
-        subset_data = {grade: self._data[grade] for grade in grades}
-        return self.from_dict(rating_scale=subset_data)
+        # Subset of already validated data, so skip validation and copying
+        return self._from_trusted(dict(zip(self._stored_keys(grades), subset_values)))
 
     def add_rating_grades(
         self, additional_grades: dict[RatingGrade, float]
@@ -450,13 +846,20 @@ class Metadata(_ImmutableMapping[str, Any]):
     metadata : dict[str, Any]
         The metadata dictionary (read-only property).
 
+    Notes
+    -----
+    Only the top-level metadata dictionary is copied, so construction is
+    proportional to the number of metadata items rather than the size of any
+    nested values. Nested values such as lists or dictionaries are shared with
+    the input and should not be mutated after the Metadata is created.
+
     Examples
     --------
     >>> metadata = Metadata({"model_version": "v2.1", "institution": "ABC Bank"})
     >>> metadata.model_version
-    "v2.1"
+    'v2.1'
     >>> metadata["institution"]
-    "ABC Bank"
+    'ABC Bank'
     >>> len(metadata)
     2
 
@@ -471,34 +874,68 @@ class Metadata(_ImmutableMapping[str, Any]):
     3
     """
 
+    # Metadata items are exposed as instance attributes, so keep a __dict__
+    __slots__ = ("__dict__",)
+
     def __init__(self, metadata: dict[str, Any] | None = None) -> None:
         """Initialize metadata with optional dictionary."""
         super().__init__(metadata)
-        for key, value in self._data.items():
-            object.__setattr__(self, key, value)
 
-    def _validate_data(self) -> None:
+    @staticmethod
+    def _copy_data(data: dict[str, Any]) -> dict[str, Any]:
+        """Copy the metadata, interning string metadata items.
+
+        Metadata items are looked up by name and exposed as attributes, so
+        interning them lets dictionary and attribute lookups short-circuit on
+        identity. Non-string keys are kept as is and rejected by validation.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            Non-empty metadata mapping
+
+        Returns
+        -------
+        dict[str, Any]
+            New metadata mapping with interned string items
+        """
+        if not isinstance(data, Mapping):
+            # Accept the same inputs as dict(), e.g. lists of pairs
+            data = dict(data)
+        return {
+            sys.intern(key) if type(key) is str else key: value
+            for key, value in data.items()
+        }
+
+    def _validate_data(self, data: dict[str, Any]) -> None:
         """Validate that all keys are valid Python identifiers."""
-        key_errors = []
-        for key in self._data.keys():
-            err_msg = ""
-            if not isinstance(key, str):
-                err_msg = f"Metadata key must be string, got {type(key).__name__}"
-            if not key.isidentifier():
-                err_msg += f"Metadata key '{key}' is not a valid Python identifier"
-            if err_msg != "":
-                key_errors.append(
-                    f"Metadata key must be string, got {type(key).__name__}"
+        if not data:
+            return None
+
+        invalid_keys = [
+            key
+            for key in data
+            if not (isinstance(key, str) and key.isidentifier() and not iskeyword(key))
+        ]
+        if invalid_keys:
+            key_errors = [
+                (
+                    f"Metadata key '{key}' is not a valid Python identifier"
+                    if isinstance(key, str)
+                    else f"Metadata key must be string, got {type(key).__name__}"
                 )
-        raise MetadataError(
-            "Some metadata keys are not strings and valid Python identifiers."
-            f"Metadata key errors: {', '.join(key_errors)}.",
-        )
+                for key in invalid_keys
+            ]
+            raise MetadataError(
+                "Some metadata keys are not strings and valid Python identifiers. "
+                f"Metadata key errors: {'; '.join(key_errors)}.",
+                key=invalid_keys[0] if len(invalid_keys) == 1 else None,
+            )
 
     def _post_init_setup(self) -> None:
         """Set attributes dynamically for dot notation access."""
-        for key, value in self._data.items():
-            object.__setattr__(self, key, value)
+        # Single bulk update of the instance dictionary; __setattr__ is blocked
+        object.__getattribute__(self, "__dict__").update(self._data)
         return None
 
     @property
@@ -510,35 +947,35 @@ class Metadata(_ImmutableMapping[str, Any]):
         dict[str, Any]
             A copy of the internal metadata dictionary.
         """
-        return dict(self._data)
+        return self._data.copy()
 
-    def metadata_items(self) -> list[str]:
+    def metadata_items(self) -> tuple[str, ...]:
         """Get all metadata item names.
 
         Returns
         -------
-        list[str]
-            List of all metadata item names.
+        tuple[str, ...]
+            Tuple of all metadata item names.
         """
         return self.keys()
 
-    def metadata_values(self) -> list[Any]:
+    def metadata_values(self) -> tuple[Any, ...]:
         """Get all metadata values.
 
         Returns
         -------
-        list[Any]
-            List of all metadata values.
+        tuple[Any, ...]
+            Tuple of all metadata values.
         """
         return self.values()
 
-    def metadata_item_value_pairs(self) -> list[tuple[str, Any]]:
+    def metadata_item_value_pairs(self) -> tuple[tuple[str, Any], ...]:
         """Get all metadata item-value pairs.
 
         Returns
         -------
-        list[tuple[str, Any]]
-            List of (item, value) tuples.
+        tuple[tuple[str, Any], ...]
+            Tuple of (item, value) tuples.
         """
         return self.items()
 
@@ -579,19 +1016,22 @@ class Metadata(_ImmutableMapping[str, Any]):
         if not isinstance(metadata_items, list):
             metadata_items = [metadata_items]
 
-        # Validate all keys exist before creating subset
-        missing_keys = [item for item in metadata_items if item not in self._data]
-        if missing_keys:
-            available_keys = list(self._data.keys())
+        try:
+            subset_values = _get_values(self._data, metadata_items)
+        except KeyError:
+            # Only work out which keys are missing once the lookup has failed
+            missing_keys = [item for item in metadata_items if item not in self._data]
+            available_keys = list(self._keys)
             raise MetadataError(
                 f"Keys not found in metadata: {missing_keys}. "
                 f"Available keys: {available_keys}",
-                key=missing_keys[0] if len(missing_keys) == 1 else None,
-            )
+                key=missing_keys[0],
+            ) from None
 
-        # Create subset
-        subset_data = {key: self._data[key] for key in metadata_items}
-        return self.__class__(subset_data)
+        # Subset of already validated data, so skip validation and copying
+        return self._from_trusted(
+            dict(zip(self._stored_keys(metadata_items), subset_values))
+        )
 
     def add_metadata(self, additional_metadata: dict[str, Any]) -> Metadata:
         """Create new Metadata with additional metadata item-value pairs.
@@ -35,16 +35,107 @@ credit_risk_rating.rating.system._predefined : Pre-built industry standard syste
 
 from __future__ import annotations
 
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 from credit_risk_rating.exceptions import RatingScaleInputError, RatingValidationError
-from credit_risk_rating.rating.system._base import BaseRatingSystem, RatingSystemConfig
-from credit_risk_rating.rating.system._mappings import Metadata, RatingGrade, RatingMap
+from credit_risk_rating.rating.system._base import (
+    _CUSTOM_CLASS_CACHE,
+    BaseRatingSystem,
+    RatingSystemConfig,
+    _freeze_config,
+    _read_only_array,
+    _require_numpy,
+    np,
+)
+from credit_risk_rating.rating.system._mappings import (
+    Metadata,
+    RatingGrade,
+    RatingScale,
+)
 
 __all__: list[str] = ["OneDimensionalRatingSystem"]
 __author__: list[str] = ["RNKuhns"]
 
 
+def _grade_mismatch_error(
+    required_grades: Iterable[RatingGrade],
+    required_grades_set: frozenset[RatingGrade],
+    actual_grades: frozenset[RatingGrade],
+) -> RatingValidationError:
+    """Describe how a rating scale's grades differ from the required grades.
+
+    Parameters
+    ----------
+    required_grades : Iterable[RatingGrade]
+        Required grades, in the order given by the class configuration
+    required_grades_set : frozenset[RatingGrade]
+        Required grades as a set
+    actual_grades : frozenset[RatingGrade]
+        Grades found in the rating scale
+
+    Returns
+    -------
+    RatingValidationError
+        Error listing the missing and extra grades
+    """
+    # Sort the actual grades once; filtering keeps the extra grades sorted
+    sorted_actual_grades = sorted(actual_grades)
+    missing_grades = required_grades_set - actual_grades
+    extra_grades = [
+        grade for grade in sorted_actual_grades if grade not in required_grades_set
+    ]
+
+    error_messages = []
+
+    if missing_grades:
+        error_messages.append(f"Missing required grades: {sorted(missing_grades)}")
+
+    if extra_grades:
+        error_messages.append(f"Extra grades not allowed: {extra_grades}")
+
+    error_messages.append(f"Required grades: {list(required_grades)}")
+    error_messages.append(f"Actual grades: {sorted_actual_grades}")
+
+    return RatingValidationError(
+        "Rating scale validation failed:\n"
+        + "\n".join(f"  - {msg}" for msg in error_messages)
+    )
+
+
+def _required_grades_validator(required_grades: tuple[RatingGrade, ...]):
+    """Build a ``_validate_required_grades`` method for fixed required grades.
+
+    The returned function closes over the required grades, so validating an
+    instance is a single set comparison with no class attribute lookups.
+
+    Parameters
+    ----------
+    required_grades : tuple[RatingGrade, ...]
+        Required grades from the class configuration
+
+    Returns
+    -------
+    Callable[[OneDimensionalRatingSystem], None]
+        Validator to assign as the class's ``_validate_required_grades``
+    """
+    required_grades_set = frozenset(required_grades)
+
+    def _validate_required_grades(self: OneDimensionalRatingSystem) -> None:
+        """Validate that rating scale contains exactly the required grades."""
+        actual_grades = frozenset(self.rating_scale.rating_grades())
+        if actual_grades != required_grades_set:
+            raise _grade_mismatch_error(
+                required_grades, required_grades_set, actual_grades
+            )
+
+    _validate_required_grades._from_config = True
+    return _validate_required_grades
+
+
 class OneDimensionalRatingSystem(BaseRatingSystem):
     """One-dimensional rating system with a single rating scale.
 
@@ -54,14 +145,14 @@ class OneDimensionalRatingSystem(BaseRatingSystem):
 
     Parameters
     ----------
-    rating_scale : dict[RatingGrade, float] | RatingMap | None, optional
+    rating_scale : dict[RatingGrade, float] | RatingScale | None, optional
         Rating scale mapping grades to values, by default None
     metadata : dict[str, Any] | Metadata | None, optional
         Metadata about the rating system, by default None
 
     Attributes
     ----------
-    rating_scale : RatingMap
+    rating_scale : RatingScale
         Immutable rating scale mapping
     metadata : Metadata
         Immutable metadata container
@@ -75,50 +166,100 @@ class OneDimensionalRatingSystem(BaseRatingSystem):
     ... )
 
     >>> # Access grades and values
-    >>> system.rating_grades  # ["A", "B", "C"]
-    >>> system.rating_scale["A"]  # 0.01
-    >>> system.is_valid_rating("A")  # True
+    >>> system.rating_grades
+    ('A', 'B', 'C')
+    >>> system.rating_scale["A"]
+    0.01
+    >>> system.is_valid_rating("A")
+    True
     """
 
+    # Lazily built caches are slots too, so instances carry no __dict__
+    __slots__ = (
+        "rating_scale",
+        "_grade_positions",
+        "_sorted_values",
+        "_hash",
+        "_values_array",
+    )
+
+    # Derived from _CONFIG once per class in __init_subclass__
+    _REQUIRED_GRADES_TUPLE: tuple[RatingGrade, ...] = ()
+    _REQUIRED_GRADES_SET: frozenset[RatingGrade] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute the required grades from the class configuration.
+
+        The required grades are frozen into a set once per class, so that
+        validating each new instance does not rebuild it from ``_CONFIG``.
+        Unless a class defines its own ``_validate_required_grades``, it is
+        given a validator specialized to its required grades.
+        """
+        super().__init_subclass__(**kwargs)
+        required_grades = cls._CONFIG.get("required_grades", ())
+        cls._REQUIRED_GRADES_TUPLE = required_grades
+        cls._REQUIRED_GRADES_SET = frozenset(required_grades)
+
+        generic_validator = OneDimensionalRatingSystem._validate_required_grades
+        validator = cls._validate_required_grades
+        if validator is generic_validator or getattr(validator, "_from_config", False):
+            cls._validate_required_grades = (
+                _required_grades_validator(required_grades)
+                if required_grades
+                else generic_validator
+            )
+
     def __init__(
         self,
-        rating_scale: dict[RatingGrade, float] | RatingMap | None = None,
+        rating_scale: dict[RatingGrade, float] | RatingScale | None = None,
         metadata: dict[str, Any] | Metadata | None = None,
     ):
         """Initialize one-dimensional rating system.
 
         Parameters
         ----------
-        rating_scale : dict[RatingGrade, float] | RatingMap | None, optional
+        rating_scale : dict[RatingGrade, float] | RatingScale | None, optional
             Rating scale mapping grades to values, by default None
         metadata : dict[str, Any] | Metadata | None, optional
             Metadata about the rating system, by default None
         """
-        # Process rating scale input
-        self.rating_scale = self._process_rating_scale_input(rating_scale)
-
         # Initialize metadata (calls validation)
         super().__init__(metadata)
 
-        # Validate rating scale requirements
+        # Process and validate rating scale
+        self._init_rating_scales(rating_scale=rating_scale)
+
+    def _init_rating_scales(
+        self, rating_scale: dict[RatingGrade, float] | RatingScale | None = None
+    ) -> None:
+        """Process and validate the rating scale of a new instance.
+
+        Parameters
+        ----------
+        rating_scale : dict[RatingGrade, float] | RatingScale | None, optional
+            Rating scale mapping grades to values, by default None
+        """
+        object.__setattr__(
+            self, "rating_scale", self._process_rating_scale_input(rating_scale)
+        )
         self._validate_required_grades()
 
     def _process_rating_scale_input(
-        self, rating_scale: dict[RatingGrade, float] | RatingMap | None
-    ) -> RatingMap:
+        self, rating_scale: dict[RatingGrade, float] | RatingScale | None
+    ) -> RatingScale:
         """Process and validate rating scale input.
 
-        Converts various rating scale input types into a standardized RatingMap
+        Converts various rating scale input types into a standardized RatingScale
         object, ensuring type safety and consistency.
 
         Parameters
         ----------
-        rating_scale : dict[RatingGrade, float] | RatingMap | None
+        rating_scale : dict[RatingGrade, float] | RatingScale | None
             Input rating scale to process
 
         Returns
         -------
-        RatingMap
+        RatingScale
             Processed rating scale object
 
         Raises
@@ -126,14 +267,21 @@ class OneDimensionalRatingSystem(BaseRatingSystem):
         RatingScaleInputError
             If rating scale input is invalid type
         """
-        if isinstance(rating_scale, RatingMap):
+        # Order checks by frequency, using exact type checks before isinstance
+        rating_scale_type = type(rating_scale)
+        if rating_scale_type is RatingScale:
+            return rating_scale
+        elif rating_scale_type is dict or rating_scale is None:
+            return RatingScale.from_dict(rating_scale)
+        # Fall back to isinstance for subclasses of RatingScale or dict
+        elif isinstance(rating_scale, RatingScale):
             return rating_scale
-        elif isinstance(rating_scale, dict) or rating_scale is None:
-            return RatingMap.from_dict(rating_scale)
+        elif isinstance(rating_scale, dict):
+            return RatingScale.from_dict(rating_scale)
         else:
             raise RatingScaleInputError(
-                f"Expected rating_scale parameter to have type dict or RatingMap. "
-                f"Found type {type(rating_scale)} instead."
+                f"Expected rating_scale parameter to have type dict or RatingScale. "
+                f"Found type {rating_scale_type} instead."
             )
 
     def _validate_required_grades(self) -> None:
@@ -148,68 +296,49 @@ class OneDimensionalRatingSystem(BaseRatingSystem):
         RatingValidationError
             If required grades are missing or extra grades are present
         """
-        if not hasattr(self, "_CONFIG") or not self._CONFIG:
-            return  # No requirements to validate
-
-        required_grades = self._CONFIG.get("required_grades", [])
-        if not required_grades:
+        required_grades_set = self._REQUIRED_GRADES_SET
+        if not required_grades_set:
             return  # No grade requirements
 
-        actual_grades = set(self.rating_scale.rating_grades())
-        required_grades_set = set(required_grades)
-
-        missing_grades = required_grades_set - actual_grades
-        extra_grades = actual_grades - required_grades_set
-
-        error_messages = []
-
-        if missing_grades:
-            error_messages.append(f"Missing required grades: {sorted(missing_grades)}")
-
-        if extra_grades:
-            error_messages.append(f"Extra grades not allowed: {sorted(extra_grades)}")
-
-        if error_messages:
-            error_messages.append(f"Required grades: {required_grades}")
-            error_messages.append(f"Actual grades: {sorted(actual_grades)}")
-
-            raise RatingValidationError(
-                "Rating scale validation failed:\n"
-                + "\n".join(f"  - {msg}" for msg in error_messages)
+        actual_grades = frozenset(self.rating_scale.rating_grades())
+        if actual_grades != required_grades_set:
+            # The differences are only needed to describe the failure
+            raise _grade_mismatch_error(
+                self._CONFIG["required_grades"], required_grades_set, actual_grades
             )
 
     @property
-    def rating_grades(self) -> list[RatingGrade]:
-        """Get the ordered list of rating grades.
+    def rating_grades(self) -> tuple[RatingGrade, ...]:
+        """Get the ordered rating grades.
 
         Returns
         -------
-        list[RatingGrade]
-            List of rating grades in the scale
+        tuple[RatingGrade, ...]
+            Rating grades in the scale, cached by the rating scale
         """
         return self.rating_scale.rating_grades()
 
     @property
-    def rating_values(self) -> list[float]:
-        """Get the ordered list of rating values.
+    def rating_values(self) -> tuple[float, ...]:
+        """Get the ordered rating values.
 
         Returns
         -------
-        list[float]
-            List of rating values in the scale
+        tuple[float, ...]
+            Rating values in the scale, cached by the rating scale
         """
         return self.rating_scale.rating_values()
 
-    def get_rating_grades(self) -> list[RatingGrade]:
+    def get_rating_grades(self) -> tuple[RatingGrade, ...]:
         """Get the rating grades for this system.
 
         Implementation of the abstract method from BaseRatingSystem.
-        For one-dimensional systems, this returns the list of grades.
+        For one-dimensional systems, this returns the ordered grades.
 
         Returns
         -------
-        list[RatingGrade]
-            List of rating grades in the scale
+        tuple[RatingGrade, ...]
+            Rating grades in the scale
         """
         return self.rating_grades
 
@@ -229,11 +358,93 @@ class OneDimensionalRatingSystem(BaseRatingSystem):
         Examples
         --------
         >>> system = OneDimensionalRatingSystem(rating_scale={"A": 0.01, "B": 0.05})
-        >>> system.is_valid_rating("A")  # True
-        >>> system.is_valid_rating("C")  # False
+        >>> system.is_valid_rating("A")
+        True
+        >>> system.is_valid_rating("C")
+        False
         """
         return self.rating_scale.has_grade(rating)
 
+    def is_valid_ratings(self, ratings: Iterable[RatingGrade]) -> np.ndarray:
+        """Check many ratings against the scale in a single pass.
+
+        Array counterpart of `is_valid_rating` for columns of ratings, e.g. a
+        NumPy array or pandas Series.
+
+        Parameters
+        ----------
+        ratings : Iterable[RatingGrade]
+            Rating grades to validate
+
+        Returns
+        -------
+        np.ndarray
+            Boolean array that is True where the rating is in the scale
+
+        Raises
+        ------
+        ImportError
+            If ``numpy`` is not installed
+
+        Examples
+        --------
+        >>> system = OneDimensionalRatingSystem(rating_scale={"A": 0.01, "B": 0.05})
+        >>> system.is_valid_ratings(["A", "C", "B"]).tolist()
+        [True, False, True]
+        """
+        _require_numpy()
+        return np.fromiter(
+            map(self.rating_scale.as_view().__contains__, ratings), dtype=np.bool_
+        )
+
+    def _get_grade_positions(self) -> dict[RatingGrade, int]:
+        """Get the index from rating grade to position, building it on first use.
+
+        Returns
+        -------
+        dict[RatingGrade, int]
+            Zero-indexed position of each rating grade in the scale
+        """
+        grade_positions = getattr(self, "_grade_positions", None)
+        if grade_positions is None:
+            grade_positions = {
+                grade: position
+                for position, grade in enumerate(self.rating_scale.rating_grades())
+            }
+            object.__setattr__(self, "_grade_positions", grade_positions)
+        return grade_positions
+
+    @classmethod
+    def is_required_grade(cls, rating: RatingGrade) -> bool:
+        """Check if a rating is one of the grades required by the class.
+
+        Unlike `is_valid_rating`, this checks the class configuration rather
+        than an instance's rating scale, so ratings can be validated without
+        creating a rating system.
+
+        Parameters
+        ----------
+        rating : RatingGrade
+            Rating grade to check
+
+        Returns
+        -------
+        bool
+            True if the class configuration requires the rating grade, False
+            otherwise (including for classes without required grades)
+
+        Examples
+        --------
+        >>> MySystem = OneDimensionalRatingSystem.create_custom_class(
+        ...     "MySystem", {"required_grades": ["A", "B"]}
+        ... )
+        >>> MySystem.is_required_grade("A")
+        True
+        >>> MySystem.is_required_grade("C")
+        False
+        """
+        return rating in cls._REQUIRED_GRADES_SET
+
     def get_rating_position(self, rating_grade: RatingGrade) -> int:
         """Get the position of a rating in the scale (0-indexed).
 
@@ -252,14 +463,81 @@ class OneDimensionalRatingSystem(BaseRatingSystem):
         ValueError
             If rating grade is not found in the scale
 
+        Notes
+        -----
+        Positions are indexed in a dictionary on first use, so repeated lookups
+        take constant time instead of scanning the grades.
+
         Examples
         --------
-        >>> system = OneDimensionalRatingSystem(rating_scale={"A": 0.01, "B": 0.05, "C": 0.10})
-        >>> system.get_rating_position("B")  # 1
+        >>> system = OneDimensionalRatingSystem(
+        ...     rating_scale={"A": 0.01, "B": 0.05, "C": 0.10}
+        ... )
+        >>> system.get_rating_position("B")
+        1
         """
-        if not self.is_valid_rating(rating_grade):
-            raise ValueError(f"Rating {rating_grade} not found in rating scale.")
-        return self.rating_grades.index(rating_grade)
+        try:
+            return self._get_grade_positions()[rating_grade]
+        except KeyError:
+            raise ValueError(
+                f"Rating {rating_grade} not found in rating scale."
+            ) from None
+
+    def get_position_by_value(self, value: float) -> int:
+        """Get the position of the first rating whose value is at least `value`.
+
+        Maps a value, such as an estimated probability of default, onto the
+        rating scale. The scale's values must be in ascending order.
+
+        Parameters
+        ----------
+        value : float
+            Value to locate in the rating scale
+
+        Returns
+        -------
+        int
+            Zero-indexed position of the first rating with a value greater than
+            or equal to `value`
+
+        Raises
+        ------
+        ValueError
+            If the rating values are not in ascending order, or `value` is
+            greater than the largest rating value
+
+        Notes
+        -----
+        The ordering of the values is checked on first use and the values are
+        stored in an array, so later lookups are a binary search.
+
+        Examples
+        --------
+        >>> system = OneDimensionalRatingSystem(
+        ...     rating_scale={"A": 0.01, "B": 0.05, "C": 0.10}
+        ... )
+        >>> system.get_position_by_value(0.03)
+        1
+        """
+        sorted_values = getattr(self, "_sorted_values", None)
+        if sorted_values is None:
+            values = self.rating_scale.rating_values()
+            if all(lower <= upper for lower, upper in zip(values, values[1:])):
+                sorted_values = array("d", values)
+            else:
+                sorted_values = False
+            object.__setattr__(self, "_sorted_values", sorted_values)
+        if sorted_values is False:
+            raise ValueError(
+                "Rating values must be in ascending order to look up positions "
+                "by value."
+            )
+        position = bisect_left(sorted_values, value)
+        if position == len(sorted_values):
+            raise ValueError(
+                f"Value {value} is greater than the largest value in the rating scale."
+            )
+        return position
 
     def get_rating_value(self, rating_grade: RatingGrade) -> float:
         """Get the numeric value for a rating grade.
@@ -282,10 +560,125 @@ class OneDimensionalRatingSystem(BaseRatingSystem):
         Examples
         --------
         >>> system = OneDimensionalRatingSystem(rating_scale={"A": 0.01, "B": 0.05})
-        >>> system.get_rating_value("A")  # 0.01
+        >>> system.get_rating_value("A")
+        0.01
         """
         return self.rating_scale[rating_grade]
 
+    def get_rating_values(self, rating_grades: Iterable[RatingGrade]) -> np.ndarray:
+        """Get the numeric values for many rating grades in a single pass.
+
+        Array counterpart of `get_rating_value` for columns of ratings, e.g. a
+        NumPy array or pandas Series.
+
+        Parameters
+        ----------
+        rating_grades : Iterable[RatingGrade]
+            Rating grades to get values for
+
+        Returns
+        -------
+        np.ndarray
+            Float array with the value of each rating grade
+
+        Raises
+        ------
+        ImportError
+            If ``numpy`` is not installed
+        KeyError
+            If a rating grade is not found in the scale
+
+        Examples
+        --------
+        >>> system = OneDimensionalRatingSystem(rating_scale={"A": 0.01, "B": 0.05})
+        >>> system.get_rating_values(["B", "A"]).tolist()
+        [0.05, 0.01]
+        """
+        _require_numpy()
+        return np.fromiter(
+            map(self.rating_scale.as_view().__getitem__, rating_grades),
+            dtype=np.float64,
+        )
+
+    def __reduce__(self):
+        """Support pickling and copying by reconstructing from the data."""
+        return (self.__class__, (self.rating_scale, self.metadata))
+
+    def __eq__(self, other: object) -> bool:
+        """Check equality with another rating system.
+
+        Rating systems are equal if they are of the same class and have equal
+        rating scales and metadata.
+
+        Parameters
+        ----------
+        other : object
+            Object to compare with
+
+        Returns
+        -------
+        bool
+            True if the rating systems are equal, False otherwise
+        """
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return (
+            self.rating_scale == other.rating_scale and self.metadata == other.metadata
+        )
+
+    def __hash__(self) -> int:
+        """Get hash of the rating system.
+
+        Returns
+        -------
+        int
+            Hash of the class, rating scale and metadata, computed on first use
+
+        Raises
+        ------
+        TypeError
+            If the metadata holds unhashable values
+        """
+        hash_value = getattr(self, "_hash", None)
+        if hash_value is None:
+            hash_value = hash((type(self), self.rating_scale, self.metadata))
+            object.__setattr__(self, "_hash", hash_value)
+        return hash_value
+
+    def value_lookup_table(self) -> tuple[Mapping[RatingGrade, int], np.ndarray]:
+        """Get position and value lookup tables for numeric rollups.
+
+        Grades can be encoded as positions once, after which rating values
+        are gathered from the value array with NumPy indexing (or inside
+        compiled code) without any per-rating dictionary lookups.
+
+        Returns
+        -------
+        tuple[Mapping[RatingGrade, int], np.ndarray]
+            Read-only mapping from rating grade to position, and read-only
+            float array holding the rating value at each position
+
+        Raises
+        ------
+        ImportError
+            If ``numpy`` is not installed
+
+        Examples
+        --------
+        >>> system = OneDimensionalRatingSystem(rating_scale={"A": 0.01, "B": 0.05})
+        >>> positions, values = system.value_lookup_table()
+        >>> portfolio = [positions["B"], positions["A"], positions["B"]]
+        >>> round(float(values[portfolio].sum()), 2)
+        0.11
+        """
+        values_array = getattr(self, "_values_array", None)
+        if values_array is None:
+            values_array = _read_only_array(self.rating_scale.rating_values())
+            object.__setattr__(self, "_values_array", values_array)
+        return MappingProxyType(self._get_grade_positions()), values_array
+
     def to_dict(self) -> dict[str, Any]:
         """Export rating system to dictionary representation.
 
@@ -305,13 +698,14 @@ class OneDimensionalRatingSystem(BaseRatingSystem):
         ...     metadata={"institution": "ABC Bank"}
         ... )
         >>> data = system.to_dict()
-        >>> data['rating_system_type']  # 'OneDimensionalRatingSystem'
+        >>> data['rating_system_type']
+        'OneDimensionalRatingSystem'
         """
         return {
             "rating_system_type": self.__class__.__name__,
             "rating_scale": self.rating_scale.to_dict(),
             "metadata": self.metadata.to_dict(),
-            "config": self.get_config(),
+            "config": self.get_config_copy(),
         }
 
     @classmethod
@@ -370,6 +764,12 @@ class OneDimensionalRatingSystem(BaseRatingSystem):
         RatingScaleInputError
             If configuration is missing required fields
 
+        Notes
+        -----
+        Classes are cached by name and configuration, so calling this method
+        again with an equal configuration returns the same class object while
+        that class is still in use.
+
         Examples
         --------
         >>> from credit_risk_rating.rating.system._base import RatingSystemConfig
@@ -394,12 +794,26 @@ class OneDimensionalRatingSystem(BaseRatingSystem):
         if "required_grades" not in config:
             raise RatingScaleInputError("Configuration must include 'required_grades'")
 
-        # Create new class dynamically
+        # Equivalent requests share one class, keeping isinstance checks and
+        # class-level caches consistent across calls
+        try:
+            cache_key = (cls, name, _freeze_config(config))
+            cached_class = _CUSTOM_CLASS_CACHE.get(cache_key)
+        except TypeError:  # Configuration holds unhashable values
+            cache_key = cached_class = None
+        if cached_class is not None:
+            return cached_class
+
+        # Create new class dynamically. The configuration is normalized into
+        # a fresh dictionary by __init_subclass__, so it is not copied here
         class_attrs = {
-            "_CONFIG": config.copy(),
+            "_CONFIG": config,
+            "__slots__": (),
             "__module__": cls.__module__,
             "__qualname__": name,
         }
 
         new_class = type(name, (cls,), class_attrs)
+        if cache_key is not None:
+            new_class = _CUSTOM_CLASS_CACHE.setdefault(cache_key, new_class)
         return new_class
@@ -0,0 +1,65 @@
+"""JSON serialization helpers for rating systems and mappings.
+
+This module centralizes JSON encoding so that rating systems and their mapping
+containers produce consistent output with the standard library ``json`` module.
+
+Examples
+--------
+>>> from credit_risk_rating.rating.system._serialization import dumps_json
+>>> print(dumps_json({"A": 0.01}))
+{
+  "A": 0.01
+}
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Mapping
+from typing import Any
+
+__all__: list[str] = ["dumps_json"]
+__author__: list[str] = ["RNKuhns"]
+
+
+def _default(obj: Any) -> dict[Any, Any]:
+    """Convert read-only mappings (e.g. ``MappingProxyType``) to dictionaries.
+
+    Parameters
+    ----------
+    obj : Any
+        Object the JSON encoder could not serialize natively.
+
+    Returns
+    -------
+    dict[Any, Any]
+        Dictionary with the same key-value pairs as `obj`.
+
+    Raises
+    ------
+    TypeError
+        If `obj` is not a mapping.
+    """
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_json(obj: Any, indent: int | None = 2) -> str:
+    """Serialize an object to a JSON formatted string.
+
+    Parameters
+    ----------
+    obj : Any
+        JSON serializable object. Read-only mappings such as
+        ``MappingProxyType`` are serialized like dictionaries, so immutable
+        containers can pass their internal data directly.
+    indent : int | None, default=2
+        The number of spaces to indent the json hierarchy.
+
+    Returns
+    -------
+    str
+        JSON string representation of `obj`.
+    """
+    return json.dumps(obj, indent=indent, default=_default)
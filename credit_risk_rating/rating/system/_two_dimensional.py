@@ -8,6 +8,22 @@ are rated separately.
 The module includes factory methods for creating custom two-dimensional rating
 systems with configurable requirements for both dimensions.
 
+Notes
+-----
+Performance notes:
+
+- Per-instance work (grade validation, membership checks, single expected loss
+  calculations) is dominated by Python object overhead rather than arithmetic.
+  It is sped up by precomputing at class creation, caching on the instance
+  (grade frozensets, read-only value arrays) and
+  using ``__slots__``.
+- Portfolio-scale expected loss is bound by memory bandwidth and is served by
+  `get_expected_loss_batch`, which gathers values into NumPy arrays and
+  multiplies them in a single vectorized pass.
+- Compiled extensions (e.g. Numba or Cython) are not worth their added
+  dependencies here, because each element needs only a single multiplication
+  once its values have been looked up.
+
 Examples
 --------
 >>> from credit_risk_rating.rating.system._two_dimensional import \
@@ -40,14 +56,25 @@ credit_risk_rating.rating.system._predefined : Pre-built industry standard syste
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
+from types import MappingProxyType
 from typing import Any
 
 from credit_risk_rating.exceptions import RatingScaleInputError, RatingValidationError
 from credit_risk_rating.rating.system._base import (
+    _CUSTOM_CLASS_CACHE,
     BaseRatingSystem,
     PDLGDRatingSystemConfig,
+    _freeze_config,
+    _read_only_array,
+    _require_numpy,
+    np,
+)
+from credit_risk_rating.rating.system._mappings import (
+    Metadata,
+    RatingGrade,
+    RatingScale,
 )
-from credit_risk_rating.rating.system._mappings import Metadata, RatingGrade, RatingMap
 
 __all__: list[str] = ["PDLGDRatingSystem"]
 __author__: list[str] = ["RNKuhns"]
@@ -63,18 +90,18 @@ class PDLGDRatingSystem(BaseRatingSystem):
 
     Parameters
     ----------
-    pd_rating_scale : dict[RatingGrade, float] | RatingMap | None, optional
+    pd_rating_scale : dict[RatingGrade, float] | RatingScale | None, optional
         PD rating scale mapping grades to values, by default None
-    lgd_rating_scale : dict[RatingGrade, float] | RatingMap | None, optional
+    lgd_rating_scale : dict[RatingGrade, float] | RatingScale | None, optional
         LGD rating scale mapping grades to values, by default None
     metadata : dict[str, Any] | Metadata | None, optional
         Metadata about the rating system, by default None
 
     Attributes
     ----------
-    pd_rating_scale : RatingMap
+    pd_rating_scale : RatingScale
         Immutable PD rating scale mapping
-    lgd_rating_scale : RatingMap
+    lgd_rating_scale : RatingScale
         Immutable LGD rating scale mapping
     metadata : Metadata
         Immutable metadata container
@@ -88,63 +115,124 @@ class PDLGDRatingSystem(BaseRatingSystem):
     ... )
     >>>
     >>> # Access grades for each dimension
-    >>> system.pd_rating_grades  # [1, 2, 3]
-    >>> system.lgd_rating_grades  # ["A", "B", "C"]
+    >>> system.pd_rating_grades
+    (1, 2, 3)
+    >>> system.lgd_rating_grades
+    ('A', 'B', 'C')
     >>>
     >>> # Validate ratings for each dimension
-    >>> system.is_valid_pd_rating(1)   # True
-    >>> system.is_valid_lgd_rating("A")  # True
+    >>> system.is_valid_pd_rating(1)
+    True
+    >>> system.is_valid_lgd_rating("A")
+    True
     """
 
+    # Lazily built caches are slots too, so instances carry no __dict__
+    __slots__ = (
+        "pd_rating_scale",
+        "lgd_rating_scale",
+        "_pd_grade_set",
+        "_lgd_grade_set",
+        "_pd_values_array",
+        "_lgd_values_array",
+    )
+
+    # Derived from _CONFIG once per class in __init_subclass__. A dimension's
+    # set is None when the configuration places no requirements on it
+    _REQUIRED_GRADE_DIMENSIONS: Mapping[str, tuple[RatingGrade, ...]] = (
+        MappingProxyType({})
+    )
+    _PD_REQUIRED_SET: frozenset[RatingGrade] | None = None
+    _LGD_REQUIRED_SET: frozenset[RatingGrade] | None = None
+    _HAS_GRADE_REQUIREMENTS: bool = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute the required grades of each dimension from the configuration.
+
+        The required grades are frozen into sets once per class, so that
+        validating each new instance does not rebuild them from ``_CONFIG``.
+        """
+        super().__init_subclass__(**kwargs)
+        dimensions = cls._CONFIG.get("required_grade_dimensions") or {}
+        cls._REQUIRED_GRADE_DIMENSIONS = MappingProxyType(dimensions)
+        cls._PD_REQUIRED_SET = (
+            frozenset(dimensions["pd"]) if "pd" in dimensions else None
+        )
+        cls._LGD_REQUIRED_SET = (
+            frozenset(dimensions["lgd"]) if "lgd" in dimensions else None
+        )
+        cls._HAS_GRADE_REQUIREMENTS = (
+            cls._PD_REQUIRED_SET is not None or cls._LGD_REQUIRED_SET is not None
+        )
+
     def __init__(
         self,
-        pd_rating_scale: dict[RatingGrade, float] | RatingMap | None = None,
-        lgd_rating_scale: dict[RatingGrade, float] | RatingMap | None = None,
+        pd_rating_scale: dict[RatingGrade, float] | RatingScale | None = None,
+        lgd_rating_scale: dict[RatingGrade, float] | RatingScale | None = None,
         metadata: dict[str, Any] | Metadata | None = None,
     ):
         """Initialize two-dimensional PD/LGD rating system.
 
         Parameters
         ----------
-        pd_rating_scale : dict[RatingGrade, float] | RatingMap | None, optional
+        pd_rating_scale : dict[RatingGrade, float] | RatingScale | None, optional
             PD rating scale mapping grades to values, by default None
-        lgd_rating_scale : dict[RatingGrade, float] | RatingMap | None, optional
+        lgd_rating_scale : dict[RatingGrade, float] | RatingScale | None, optional
             LGD rating scale mapping grades to values, by default None
         metadata : dict[str, Any] | Metadata | None, optional
             Metadata about the rating system, by default None
         """
-        # Process rating scale inputs
-        self.pd_rating_scale = self._process_rating_scale_input(pd_rating_scale, "pd")
-        self.lgd_rating_scale = self._process_rating_scale_input(
-            lgd_rating_scale, "lgd"
-        )
-
         # Initialize metadata (calls validation)
         super().__init__(metadata)
 
-        # Validate rating scale requirements
+        # Process and validate rating scales
+        self._init_rating_scales(
+            pd_rating_scale=pd_rating_scale, lgd_rating_scale=lgd_rating_scale
+        )
+
+    def _init_rating_scales(
+        self,
+        pd_rating_scale: dict[RatingGrade, float] | RatingScale | None = None,
+        lgd_rating_scale: dict[RatingGrade, float] | RatingScale | None = None,
+    ) -> None:
+        """Process and validate the PD and LGD rating scales of a new instance.
+
+        Parameters
+        ----------
+        pd_rating_scale : dict[RatingGrade, float] | RatingScale | None, optional
+            PD rating scale mapping grades to values, by default None
+        lgd_rating_scale : dict[RatingGrade, float] | RatingScale | None, optional
+            LGD rating scale mapping grades to values, by default None
+        """
+        pd_scale = self._process_rating_scale_input(pd_rating_scale, "pd")
+        lgd_scale = self._process_rating_scale_input(lgd_rating_scale, "lgd")
+        object.__setattr__(self, "pd_rating_scale", pd_scale)
+        object.__setattr__(self, "lgd_rating_scale", lgd_scale)
+        # Grade sets back the is_valid_*_rating checks and grade validation
+        object.__setattr__(self, "_pd_grade_set", frozenset(pd_scale.rating_grades()))
+        object.__setattr__(self, "_lgd_grade_set", frozenset(lgd_scale.rating_grades()))
         self._validate_required_grade_dimensions()
 
     def _process_rating_scale_input(
         self,
-        rating_scale: dict[RatingGrade, float] | RatingMap | None,
+        rating_scale: dict[RatingGrade, float] | RatingScale | None,
         dimension_name: str,
-    ) -> RatingMap:
+    ) -> RatingScale:
         """Process and validate rating scale input for a specific dimension.
 
-        Converts various rating scale input types into a standardized RatingMap
+        Converts various rating scale input types into a standardized RatingScale
         object for a specific dimension (PD or LGD).
 
         Parameters
         ----------
-        rating_scale : dict[RatingGrade, float] | RatingMap | None
+        rating_scale : dict[RatingGrade, float] | RatingScale | None
             Input rating scale to process
         dimension_name : str
             Name of the dimension (for error messages)
 
         Returns
         -------
-        RatingMap
+        RatingScale
             Processed rating scale object
 
         Raises
@@ -152,14 +240,21 @@ class PDLGDRatingSystem(BaseRatingSystem):
         RatingScaleInputError
             If rating scale input is invalid type
         """
-        if isinstance(rating_scale, RatingMap):
+        # Order checks by frequency, using exact type checks before isinstance
+        rating_scale_type = type(rating_scale)
+        if rating_scale_type is RatingScale:
             return rating_scale
-        elif isinstance(rating_scale, dict) or rating_scale is None:
-            return RatingMap.from_dict(rating_scale)
+        elif rating_scale_type is dict or rating_scale is None:
+            return RatingScale.from_dict(rating_scale)
+        # Fall back to isinstance for subclasses of RatingScale or dict
+        elif isinstance(rating_scale, RatingScale):
+            return rating_scale
+        elif isinstance(rating_scale, dict):
+            return RatingScale.from_dict(rating_scale)
         else:
             raise RatingScaleInputError(
-                f"Expected {dimension_name}_rating_scale parameter to have type dict or RatingMap. "
-                f"Found type {type(rating_scale)} instead."
+                f"Expected {dimension_name}_rating_scale parameter to have type dict "
+                f"or RatingScale. Found type {rating_scale_type} instead."
             )
 
     def _validate_required_grade_dimensions(self) -> None:
@@ -173,41 +268,46 @@ class PDLGDRatingSystem(BaseRatingSystem):
         RatingValidationError
             If required grades are missing or extra grades are present in either dimension
         """
-        if not hasattr(self, "_CONFIG") or not self._CONFIG:
-            return  # No requirements to validate
-
-        required_dimensions = self._CONFIG.get("required_grade_dimensions", {})
-        if not required_dimensions:
+        if not self._HAS_GRADE_REQUIREMENTS:
             return  # No dimension requirements
 
-        error_messages = []
+        required_dimensions = self._REQUIRED_GRADE_DIMENSIONS
+        pd_errors = lgd_errors = None
 
         # Validate PD dimension
-        if "pd" in required_dimensions:
+        if self._PD_REQUIRED_SET is not None:
             pd_errors = self._validate_dimension_grades(
-                self.pd_rating_scale, required_dimensions["pd"], "PD"
+                self.pd_rating_scale,
+                self._pd_grade_set,
+                required_dimensions["pd"],
+                "PD",
+                self._PD_REQUIRED_SET,
             )
-            error_messages.extend(pd_errors)
 
         # Validate LGD dimension
-        if "lgd" in required_dimensions:
+        if self._LGD_REQUIRED_SET is not None:
             lgd_errors = self._validate_dimension_grades(
-                self.lgd_rating_scale, required_dimensions["lgd"], "LGD"
+                self.lgd_rating_scale,
+                self._lgd_grade_set,
+                required_dimensions["lgd"],
+                "LGD",
+                self._LGD_REQUIRED_SET,
             )
-            error_messages.extend(lgd_errors)
 
-        if error_messages:
+        if pd_errors or lgd_errors:
             raise RatingValidationError(
                 "Rating system validation failed:\n"
-                + "\n".join(f"  - {msg}" for msg in error_messages)
+                + "\n".join(filter(None, (pd_errors, lgd_errors)))
             )
 
     def _validate_dimension_grades(
         self,
-        rating_scale: RatingMap,
-        required_grades: list[RatingGrade],
+        rating_scale: RatingScale,
+        actual_grades: frozenset[RatingGrade],
+        required_grades: tuple[RatingGrade, ...],
         dimension_name: str,
-    ) -> list[str]:
+        required_grades_set: frozenset[RatingGrade],
+    ) -> str | None:
         """Validate grades for a single dimension.
 
         Checks that a rating scale contains exactly the required grades for
@@ -215,91 +315,140 @@ class PDLGDRatingSystem(BaseRatingSystem):
 
         Parameters
         ----------
-        rating_scale : RatingMap
+        rating_scale : RatingScale
             Rating scale to validate
-        required_grades : list[RatingGrade]
+        actual_grades : frozenset[RatingGrade]
+            Grades of `rating_scale` as a set
+        required_grades : tuple[RatingGrade, ...]
             Required grades for this dimension
         dimension_name : str
             Name of the dimension for error messages
+        required_grades_set : frozenset[RatingGrade]
+            Required grades for this dimension as a set, precomputed per class
 
         Returns
         -------
-        list[str]
-            List of error messages (empty if validation passes)
+        str | None
+            Bulleted error messages, or None if validation passes
         """
-        actual_grades = set(rating_scale.rating_grades())
-        required_grades_set = set(required_grades)
-
-        missing_grades = required_grades_set - actual_grades
-        extra_grades = actual_grades - required_grades_set
+        if actual_grades == required_grades_set:
+            return None
+
+        # The differences are only needed to describe the failure. Filtering
+        # the ordered grades keeps the configured and scale orders, and avoids
+        # sorting grades that may mix integers and strings
+        rating_grades = rating_scale.rating_grades()
+        missing_grades = [
+            grade for grade in required_grades if grade not in actual_grades
+        ]
+        extra_grades = [
+            grade for grade in rating_grades if grade not in required_grades_set
+        ]
 
         error_messages = []
 
         if missing_grades:
             error_messages.append(
-                f"{dimension_name} missing required grades: {sorted(missing_grades)}"
+                f"{dimension_name} missing required grades: {missing_grades}"
             )
 
         if extra_grades:
             error_messages.append(
-                f"{dimension_name} extra grades not allowed: {sorted(extra_grades)}"
+                f"{dimension_name} extra grades not allowed: {extra_grades}"
             )
 
-        if missing_grades or extra_grades:
-            error_messages.append(
-                f"{dimension_name} required grades: {required_grades}"
-            )
-            error_messages.append(
-                f"{dimension_name} actual grades: {sorted(actual_grades)}"
-            )
+        error_messages.append(
+            f"{dimension_name} required grades: {list(required_grades)}"
+        )
+        error_messages.append(f"{dimension_name} actual grades: {list(rating_grades)}")
 
-        return error_messages
+        return "\n".join(f"  - {msg}" for msg in error_messages)
 
     @property
-    def pd_rating_grades(self) -> list[RatingGrade]:
-        """Get the ordered list of PD rating grades.
+    def pd_rating_grades(self) -> tuple[RatingGrade, ...]:
+        """Get the ordered PD rating grades.
 
         Returns
         -------
-        list[RatingGrade]
-            List of PD rating grades in the scale
+        tuple[RatingGrade, ...]
+            PD rating grades in the scale, cached by the rating scale
         """
         return self.pd_rating_scale.rating_grades()
 
     @property
-    def lgd_rating_grades(self) -> list[RatingGrade]:
-        """Get the ordered list of LGD rating grades.
+    def lgd_rating_grades(self) -> tuple[RatingGrade, ...]:
+        """Get the ordered LGD rating grades.
 
         Returns
         -------
-        list[RatingGrade]
-            List of LGD rating grades in the scale
+        tuple[RatingGrade, ...]
+            LGD rating grades in the scale, cached by the rating scale
         """
         return self.lgd_rating_scale.rating_grades()
 
     @property
-    def pd_rating_values(self) -> list[float]:
-        """Get the ordered list of PD rating values.
+    def pd_rating_values(self) -> tuple[float, ...]:
+        """Get the ordered PD rating values.
 
         Returns
         -------
-        list[float]
-            List of PD rating values in the scale
+        tuple[float, ...]
+            PD rating values in the scale, cached by the rating scale
         """
         return self.pd_rating_scale.rating_values()
 
     @property
-    def lgd_rating_values(self) -> list[float]:
-        """Get the ordered list of LGD rating values.
+    def lgd_rating_values(self) -> tuple[float, ...]:
+        """Get the ordered LGD rating values.
 
         Returns
         -------
-        list[float]
-            List of LGD rating values in the scale
+        tuple[float, ...]
+            LGD rating values in the scale, cached by the rating scale
         """
         return self.lgd_rating_scale.rating_values()
 
-    def get_rating_grades(self) -> dict[str, list[RatingGrade]]:
+    @property
+    def pd_rating_values_array(self) -> np.ndarray:
+        """Get the ordered PD rating values as a read-only NumPy array.
+
+        Returns
+        -------
+        np.ndarray
+            Float64 array of the PD rating values, built on first access
+
+        Raises
+        ------
+        ImportError
+            If ``numpy`` is not installed
+        """
+        values_array = getattr(self, "_pd_values_array", None)
+        if values_array is None:
+            values_array = _read_only_array(self.pd_rating_scale.rating_values())
+            object.__setattr__(self, "_pd_values_array", values_array)
+        return values_array
+
+    @property
+    def lgd_rating_values_array(self) -> np.ndarray:
+        """Get the ordered LGD rating values as a read-only NumPy array.
+
+        Returns
+        -------
+        np.ndarray
+            Float64 array of the LGD rating values, built on first access
+
+        Raises
+        ------
+        ImportError
+            If ``numpy`` is not installed
+        """
+        values_array = getattr(self, "_lgd_values_array", None)
+        if values_array is None:
+            values_array = _read_only_array(self.lgd_rating_scale.rating_values())
+            object.__setattr__(self, "_lgd_values_array", values_array)
+        return values_array
+
+    def get_rating_grades(self) -> dict[str, tuple[RatingGrade, ...]]:
         """Get the rating grades for both dimensions of this system.
 
         Implementation of the abstract method from BaseRatingSystem.
@@ -307,8 +456,8 @@ class PDLGDRatingSystem(BaseRatingSystem):
 
         Returns
         -------
-        dict[str, list[RatingGrade]]
-            Dictionary with 'pd' and 'lgd' keys containing respective grade lists
+        dict[str, tuple[RatingGrade, ...]]
+            Dictionary with 'pd' and 'lgd' keys containing respective grades
         """
         return {"pd": self.pd_rating_grades, "lgd": self.lgd_rating_grades}
 
@@ -331,10 +480,12 @@ class PDLGDRatingSystem(BaseRatingSystem):
         ...     pd_rating_scale={1: 0.001, 2: 0.005},
         ...     lgd_rating_scale={"A": 0.10, "B": 0.25}
         ... )
-        >>> system.is_valid_pd_rating(1)   # True
-        >>> system.is_valid_pd_rating(3)   # False
+        >>> system.is_valid_pd_rating(1)
+        True
+        >>> system.is_valid_pd_rating(3)
+        False
         """
-        return self.pd_rating_scale.has_grade(rating)
+        return rating in self._pd_grade_set
 
     def is_valid_lgd_rating(self, rating: RatingGrade) -> bool:
         """Check if a rating is valid for the LGD scale.
@@ -355,10 +506,63 @@ class PDLGDRatingSystem(BaseRatingSystem):
         ...     pd_rating_scale={1: 0.001, 2: 0.005},
         ...     lgd_rating_scale={"A": 0.10, "B": 0.25}
         ... )
-        >>> system.is_valid_lgd_rating("A")  # True
-        >>> system.is_valid_lgd_rating("C")  # False
+        >>> system.is_valid_lgd_rating("A")
+        True
+        >>> system.is_valid_lgd_rating("C")
+        False
         """
-        return self.lgd_rating_scale.has_grade(rating)
+        return rating in self._lgd_grade_set
+
+    def validate_ratings_batch(
+        self, pd_ratings: Iterable[RatingGrade], lgd_ratings: Iterable[RatingGrade]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Check many PD and LGD ratings against their scales in a single pass.
+
+        Array counterpart of `is_valid_pd_rating` and `is_valid_lgd_rating`
+        for columns of ratings, e.g. NumPy arrays or pandas Series.
+
+        Parameters
+        ----------
+        pd_ratings : Iterable[RatingGrade]
+            PD rating grades to validate
+        lgd_ratings : Iterable[RatingGrade]
+            LGD rating grades to validate
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Boolean arrays that are True where the PD and LGD ratings,
+            respectively, are in their scales
+
+        Raises
+        ------
+        ImportError
+            If ``numpy`` is not installed
+
+        Notes
+        -----
+        Membership is tested against the instance's grade sets rather than
+        with ``np.isin``, which sorts its inputs and so cannot handle scales
+        mixing integer and string grades.
+
+        Examples
+        --------
+        >>> system = PDLGDRatingSystem(
+        ...     pd_rating_scale={1: 0.001, 2: 0.005},
+        ...     lgd_rating_scale={"A": 0.10, "B": 0.25}
+        ... )
+        >>> system.validate_ratings_batch([1, 3], ["A", "B"])
+        (array([ True, False]), array([ True,  True]))
+        """
+        _require_numpy()
+        return (
+            np.fromiter(
+                map(self._pd_grade_set.__contains__, pd_ratings), dtype=np.bool_
+            ),
+            np.fromiter(
+                map(self._lgd_grade_set.__contains__, lgd_ratings), dtype=np.bool_
+            ),
+        )
 
     def get_pd_rating_value(self, rating_grade: RatingGrade) -> float:
         """Get the numeric value for a PD rating grade.
@@ -381,7 +585,8 @@ class PDLGDRatingSystem(BaseRatingSystem):
         Examples
         --------
         >>> system = PDLGDRatingSystem(pd_rating_scale={1: 0.001, 2: 0.005})
-        >>> system.get_pd_rating_value(1)  # 0.001
+        >>> system.get_pd_rating_value(1)
+        0.001
         """
         return self.pd_rating_scale[rating_grade]
 
@@ -406,7 +611,8 @@ class PDLGDRatingSystem(BaseRatingSystem):
         Examples
         --------
         >>> system = PDLGDRatingSystem(lgd_rating_scale={"A": 0.10, "B": 0.25})
-        >>> system.get_lgd_rating_value("A")  # 0.10
+        >>> system.get_lgd_rating_value("A")
+        0.1
         """
         return self.lgd_rating_scale[rating_grade]
 
@@ -442,12 +648,94 @@ class PDLGDRatingSystem(BaseRatingSystem):
         ...     pd_rating_scale={1: 0.001, 2: 0.005},
         ...     lgd_rating_scale={"A": 0.10, "B": 0.25}
         ... )
-        >>> system.get_expected_loss(1, "A", 1000000)  # 100.0
+        >>> system.get_expected_loss(1, "A", 1000000)
+        100.0
         """
         pd_value = self.get_pd_rating_value(pd_rating)
         lgd_value = self.get_lgd_rating_value(lgd_rating)
         return pd_value * lgd_value * ead
 
+    def get_expected_loss_batch(
+        self,
+        pd_ratings: Iterable[RatingGrade],
+        lgd_ratings: Iterable[RatingGrade],
+        ead: float | Iterable[float] = 1.0,
+    ) -> np.ndarray:
+        """Calculate expected losses for many exposures in a single pass.
+
+        Array counterpart of `get_expected_loss` for portfolios, where the
+        ratings are e.g. NumPy arrays or pandas Series. Each rating dimension
+        is resolved with one lookup pass and the products are computed by
+        NumPy.
+
+        Parameters
+        ----------
+        pd_ratings : Iterable[RatingGrade]
+            PD rating grade of each exposure
+        lgd_ratings : Iterable[RatingGrade]
+            LGD rating grade of each exposure
+        ead : float | Iterable[float], optional
+            Exposure at Default, either shared by all exposures or one value
+            per exposure, by default 1.0
+
+        Returns
+        -------
+        np.ndarray
+            Float array of expected loss values
+
+        Raises
+        ------
+        ImportError
+            If ``numpy`` is not installed
+        KeyError
+            If any rating grade is not found in the respective scale
+        ValueError
+            If the number of PD ratings, LGD ratings and EAD values differ
+
+        Examples
+        --------
+        >>> system = PDLGDRatingSystem(
+        ...     pd_rating_scale={1: 0.001, 2: 0.005},
+        ...     lgd_rating_scale={"A": 0.10, "B": 0.25}
+        ... )
+        >>> system.get_expected_loss_batch([1, 2], ["A", "B"], [1000000, 500000])
+        array([100., 625.])
+        """
+        _require_numpy()
+        pd_values = np.fromiter(
+            map(self.pd_rating_scale.as_view().__getitem__, pd_ratings),
+            dtype=np.float64,
+        )
+        lgd_values = np.fromiter(
+            map(self.lgd_rating_scale.as_view().__getitem__, lgd_ratings),
+            dtype=np.float64,
+        )
+        if pd_values.shape != lgd_values.shape:
+            raise ValueError(
+                f"Expected the same number of PD and LGD ratings. Found "
+                f"{pd_values.size} PD ratings and {lgd_values.size} LGD ratings."
+            )
+        if isinstance(ead, Iterable):
+            # Generators and other iterables are materialized like the ratings
+            ead = (
+                np.asarray(ead, dtype=np.float64)
+                if isinstance(ead, np.ndarray)
+                else np.fromiter(ead, dtype=np.float64)
+            )
+            if ead.ndim == 1 and ead.shape != pd_values.shape:
+                raise ValueError(
+                    f"Expected the same number of PD ratings and EAD values. Found "
+                    f"{pd_values.size} PD ratings and {ead.size} EAD values."
+                )
+        return pd_values * lgd_values * ead
+
+    def __reduce__(self):
+        """Support pickling and copying by reconstructing from the data."""
+        return (
+            self.__class__,
+            (self.pd_rating_scale, self.lgd_rating_scale, self.metadata),
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Export rating system to dictionary representation.
 
@@ -468,14 +756,15 @@ class PDLGDRatingSystem(BaseRatingSystem):
         ...     metadata={"institution": "ABC Bank"}
         ... )
         >>> data = system.to_dict()
-        >>> data['rating_system_type']  # 'PDLGDRatingSystem'
+        >>> data['rating_system_type']
+        'PDLGDRatingSystem'
         """
         return {
             "rating_system_type": self.__class__.__name__,
             "pd_rating_scale": self.pd_rating_scale.to_dict(),
             "lgd_rating_scale": self.lgd_rating_scale.to_dict(),
             "metadata": self.metadata.to_dict(),
-            "config": self.get_config(),
+            "config": self.get_config_copy(),
         }
 
     @classmethod
@@ -537,6 +826,12 @@ class PDLGDRatingSystem(BaseRatingSystem):
         RatingScaleInputError
             If configuration is missing required fields
 
+        Notes
+        -----
+        Classes are cached by name and configuration, so calling this method
+        again with an equal configuration returns the same class object while
+        that class is still in use.
+
         Examples
         --------
         >>> from credit_risk_rating.rating.system._base import PDLGDRatingSystemConfig
@@ -572,12 +867,26 @@ class PDLGDRatingSystem(BaseRatingSystem):
                 "Configuration 'required_grade_dimensions' must include both 'pd' and 'lgd' keys"
             )
 
-        # Create new class dynamically
+        # Equivalent requests share one class, keeping isinstance checks and
+        # class-level caches consistent across calls
+        try:
+            cache_key = (cls, name, _freeze_config(config))
+            cached_class = _CUSTOM_CLASS_CACHE.get(cache_key)
+        except TypeError:  # Configuration holds unhashable values
+            cache_key = cached_class = None
+        if cached_class is not None:
+            return cached_class
+
+        # Create new class dynamically. The configuration is normalized into
+        # a fresh read-only mapping by __init_subclass__, so it is not copied
         class_attrs = {
-            "_CONFIG": config.copy(),
+            "_CONFIG": config,
+            "__slots__": (),
             "__module__": cls.__module__,
             "__qualname__": name,
         }
 
         new_class = type(name, (cls,), class_attrs)
+        if cache_key is not None:
+            new_class = _CUSTOM_CLASS_CACHE.setdefault(cache_key, new_class)
         return new_class
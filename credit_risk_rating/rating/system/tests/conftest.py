@@ -0,0 +1,48 @@
+"""Shared fixtures for the :mod:`credit_risk_rating.rating.system` tests.
+
+The large rating scale and metadata fixtures are used by the benchmark modules.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from credit_risk_rating.rating.system._mappings import Metadata, RatingScale
+
+__author__: list[str] = ["RNKuhns"]
+
+# Tests routed to their own marker so they can be deselected or scheduled apart
+_SLOW_TESTS = frozenset({"test_large_datasets"})
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Mark the tests listed in `_SLOW_TESTS` as slow."""
+    for item in items:
+        if getattr(item, "originalname", None) in _SLOW_TESTS:
+            item.add_marker(pytest.mark.slow)
+
+
+@pytest.fixture
+def large_rating_scale_data() -> dict[int, float]:
+    """Source data for a rating scale with 1,000 grades."""
+    return {i: float(i) * 0.01 for i in range(1000)}
+
+
+@pytest.fixture
+def large_rating_scale(large_rating_scale_data: dict[int, float]) -> RatingScale:
+    """Rating scale with 1,000 grades."""
+    return RatingScale(large_rating_scale_data)
+
+
+@pytest.fixture
+def large_metadata_data() -> dict[str, str]:
+    """Source data for metadata with 100 fields."""
+    return {f"key_{i}": f"value_{i}" for i in range(100)}
+
+
+@pytest.fixture
+def large_metadata(large_metadata_data: dict[str, str]) -> Metadata:
+    """Metadata with 100 fields."""
+    return Metadata(large_metadata_data)
@@ -0,0 +1,253 @@
+"""Tests for credit_risk_rating.rating.system._base module.
+
+This module contains tests for the BaseRatingSystem class, covering subclass
+requirements, metadata handling and the bulk constructors shared by all rating
+systems.
+"""
+
+from __future__ import annotations
+
+import gc
+
+import pytest
+
+from credit_risk_rating.exceptions import RatingValidationError
+from credit_risk_rating.rating.system._base import (
+    _CUSTOM_CLASS_CACHE,
+    BaseRatingSystem,
+)
+from credit_risk_rating.rating.system._mappings import Metadata
+from credit_risk_rating.rating.system._one_dimensional import (
+    OneDimensionalRatingSystem,
+)
+from credit_risk_rating.rating.system._two_dimensional import PDLGDRatingSystem
+
+
+class TestAbstractMethods:
+    """Test suite for the methods subclasses must implement."""
+
+    def test_base_class_cannot_be_instantiated(self) -> None:
+        """Test that BaseRatingSystem itself cannot be instantiated."""
+        with pytest.raises(TypeError):
+            BaseRatingSystem()
+
+    def test_intermediate_abstract_subclass_can_be_defined(self) -> None:
+        """Test that subclasses may leave the abstract methods unimplemented."""
+
+        class IntermediateRatingSystem(BaseRatingSystem):
+            pass
+
+        with pytest.raises(TypeError, match="abstract"):
+            IntermediateRatingSystem()
+
+    def test_concrete_subclass_of_intermediate_subclass(self) -> None:
+        """Test that implementing the abstract methods later is allowed."""
+
+        class IntermediateRatingSystem(BaseRatingSystem):
+            pass
+
+        class ConcreteRatingSystem(IntermediateRatingSystem):
+            def get_rating_grades(self) -> tuple:
+                return ()
+
+            def to_dict(self) -> dict:
+                return {}
+
+        system = ConcreteRatingSystem(metadata={"institution": "ABC Bank"})
+        assert system.get_rating_grades() == ()
+        assert system.metadata["institution"] == "ABC Bank"
+
+    def test_custom_class_is_concrete(self) -> None:
+        """Test that classes from create_custom_class can be instantiated."""
+        custom_class = OneDimensionalRatingSystem.create_custom_class(
+            "AbstractCheckSystem", {"required_grades": ["A", "B"]}
+        )
+        system = custom_class(rating_scale={"A": 0.01, "B": 0.05})
+        assert system.rating_grades == ("A", "B")
+
+
+class TestConfig:
+    """Test suite for reading rating system class configurations."""
+
+    @pytest.fixture
+    def pd_lgd_class(self) -> type[PDLGDRatingSystem]:
+        """Fixture providing a PD/LGD rating system class."""
+        return PDLGDRatingSystem.create_custom_class(
+            "ConfigTestSystem",
+            {
+                "required_grade_dimensions": {"pd": [1, 2], "lgd": ["A"]},
+                "required_metadata": ["institution"],
+            },
+        )
+
+    def test_get_config_is_read_only(self, pd_lgd_class) -> None:
+        """Test that the configuration and its nested values are read-only."""
+        config = pd_lgd_class.get_config()
+        with pytest.raises(TypeError):
+            config["name"] = "Changed"
+        with pytest.raises(TypeError):
+            config["required_grade_dimensions"]["pd"] = ("X",)
+        assert config["required_grade_dimensions"]["pd"] == (1, 2)
+
+    def test_get_config_copy_is_independent(self, pd_lgd_class) -> None:
+        """Test that modifying a configuration copy leaves the class unchanged."""
+        config = pd_lgd_class.get_config_copy()
+        assert type(config) is dict
+        assert type(config["required_grade_dimensions"]) is dict
+
+        config["required_grade_dimensions"]["pd"] = ("X",)
+        config["required_metadata"] = ()
+
+        assert pd_lgd_class.get_config()["required_grade_dimensions"]["pd"] == (1, 2)
+        assert pd_lgd_class.get_config()["required_metadata"] == ("institution",)
+        assert pd_lgd_class.get_config_copy() != config
+
+
+class TestCustomClassCache:
+    """Test suite for reusing classes built by create_custom_class."""
+
+    @pytest.mark.parametrize(
+        "base_class, config",
+        [
+            (OneDimensionalRatingSystem, {"required_grades": ["A", "B"]}),
+            (
+                PDLGDRatingSystem,
+                {"required_grade_dimensions": {"pd": [1, 2], "lgd": ["A"]}},
+            ),
+        ],
+        ids=["one_dimensional", "pd_lgd"],
+    )
+    def test_equal_configurations_share_class(self, base_class, config) -> None:
+        """Test that equal names and configurations reuse the same class."""
+        first = base_class.create_custom_class("CachedSystem", config)
+        second = base_class.create_custom_class("CachedSystem", dict(config))
+        renamed = base_class.create_custom_class("OtherCachedSystem", config)
+
+        assert first is second
+        assert renamed is not first
+
+    def test_unused_classes_are_released(self) -> None:
+        """Test that the cache does not keep unused classes alive."""
+        custom_class = OneDimensionalRatingSystem.create_custom_class(
+            "ReleasedSystem", {"required_grades": ["A", "B"]}
+        )
+        assert custom_class in _CUSTOM_CLASS_CACHE.values()
+
+        del custom_class
+        gc.collect()
+
+        assert all(
+            cached_class.__name__ != "ReleasedSystem"
+            for cached_class in _CUSTOM_CLASS_CACHE.values()
+        )
+
+    def test_unhashable_configuration_is_not_cached(self) -> None:
+        """Test that configurations that cannot be frozen create new classes."""
+        config = {"required_grades": ["A", "B"], "owners": {"risk"}}
+        first = OneDimensionalRatingSystem.create_custom_class(
+            "UnhashableSystem", config
+        )
+        second = OneDimensionalRatingSystem.create_custom_class(
+            "UnhashableSystem", config
+        )
+
+        assert first is not second
+        assert first.get_config() == second.get_config()
+
+
+class TestUncheckedNew:
+    """Test suite for creating rating systems from validated metadata."""
+
+    def test_sets_only_metadata(self) -> None:
+        """Test that the given Metadata is stored without processing it."""
+        metadata = Metadata({"institution": "ABC Bank"})
+        system = OneDimensionalRatingSystem._unchecked_new(metadata)
+
+        assert type(system) is OneDimensionalRatingSystem
+        assert system.metadata is metadata
+        assert not hasattr(system, "rating_scale")
+
+    def test_result_is_immutable(self) -> None:
+        """Test that instances created this way block attribute assignment."""
+        system = OneDimensionalRatingSystem._unchecked_new(Metadata())
+        with pytest.raises(AttributeError, match="immutable"):
+            system.metadata = Metadata({"institution": "ABC Bank"})
+
+
+class TestFromRecords:
+    """Test suite for building many rating systems with shared metadata."""
+
+    @pytest.fixture
+    def custom_class(self) -> type[OneDimensionalRatingSystem]:
+        """Fixture providing a class with required grades and metadata."""
+        return OneDimensionalRatingSystem.create_custom_class(
+            "RecordsTestSystem",
+            {"required_grades": ["A", "B"], "required_metadata": ["institution"]},
+        )
+
+    def test_systems_share_metadata(self, custom_class) -> None:
+        """Test that every rating system reuses the same Metadata instance."""
+        systems = custom_class.from_records(
+            [
+                {"rating_scale": {"A": 0.01, "B": 0.05}},
+                {"rating_scale": {"A": 0.02, "B": 0.08}},
+            ],
+            shared_metadata={"institution": "ABC Bank"},
+        )
+
+        assert [type(system) for system in systems] == [custom_class] * 2
+        assert systems[0].metadata is systems[1].metadata
+        assert systems[1].rating_scale.to_dict() == {"A": 0.02, "B": 0.08}
+
+    def test_matches_individual_construction(self, custom_class) -> None:
+        """Test that the systems equal those built one at a time."""
+        scale = {"A": 0.01, "B": 0.05}
+        metadata = {"institution": "ABC Bank"}
+        (system,) = custom_class.from_records(
+            [{"rating_scale": scale}], shared_metadata=metadata
+        )
+        assert system == custom_class(rating_scale=scale, metadata=metadata)
+
+    def test_pd_lgd_records(self) -> None:
+        """Test that PD/LGD rating systems can be built from records."""
+        systems = PDLGDRatingSystem.from_records(
+            [
+                {
+                    "pd_rating_scale": {1: 0.001, 2: 0.005},
+                    "lgd_rating_scale": {"A": 0.10, "B": 0.25},
+                },
+            ],
+            shared_metadata=Metadata({"institution": "ABC Bank"}),
+        )
+        assert systems[0].get_expected_loss(2, "B", 1_000_000) == pytest.approx(1250.0)
+        assert systems[0].metadata["institution"] == "ABC Bank"
+
+    def test_empty_records(self, custom_class) -> None:
+        """Test that no records produce an empty list."""
+        assert custom_class.from_records([], {"institution": "ABC Bank"}) == []
+
+    def test_missing_shared_metadata_raises(self, custom_class) -> None:
+        """Test that the shared metadata is validated against the class."""
+        with pytest.raises(
+            RatingValidationError, match="Missing required metadata fields"
+        ):
+            custom_class.from_records([{"rating_scale": {"A": 0.01, "B": 0.05}}])
+
+    @pytest.mark.parametrize(
+        "rating_scale, error",
+        [
+            ({"A": 0.01}, RatingValidationError),
+            ({"A": 1, "B": 2}, TypeError),
+        ],
+        ids=["missing_grade", "int_values"],
+    )
+    def test_invalid_record_raises(self, custom_class, rating_scale, error) -> None:
+        """Test that each record's rating scale is still validated."""
+        with pytest.raises(error):
+            custom_class.from_records(
+                [
+                    {"rating_scale": {"A": 0.01, "B": 0.05}},
+                    {"rating_scale": rating_scale},
+                ],
+                shared_metadata={"institution": "ABC Bank"},
+            )
@@ -0,0 +1,57 @@
+"""Benchmarks for the hot paths of credit_risk_rating.rating._mappings.
+
+These tests time the 1,000 grade rating scale paths with ``pytest-benchmark``
+and are skipped when it is not installed. Store a baseline with
+``pytest --benchmark-save=baseline`` and compare later runs against it with
+``--benchmark-compare --benchmark-compare-fail=mean:10%``.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from credit_risk_rating.rating.system._mappings import RatingScale
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.slow
+
+
+def test_large_rating_scale_construction(
+    benchmark, large_rating_scale_data: dict[int, float]
+) -> None:
+    """Benchmark validating and building a 1,000 grade rating scale."""
+    rating_scale = benchmark(RatingScale, large_rating_scale_data)
+    assert len(rating_scale) == 1000
+
+
+def test_large_rating_scale_construction_pedantic(
+    benchmark, large_rating_scale_data: dict[int, float]
+) -> None:
+    """Benchmark building a 1,000 grade rating scale with fixed rounds."""
+    rating_scale = benchmark.pedantic(
+        RatingScale,
+        args=(large_rating_scale_data,),
+        rounds=50,
+        iterations=5,
+        warmup_rounds=2,
+    )
+    assert len(rating_scale) == 1000
+
+
+def test_large_rating_scale_subset_grades(
+    benchmark, large_rating_scale: RatingScale
+) -> None:
+    """Benchmark subsetting half of the grades of a 1,000 grade rating scale."""
+    grades = list(range(0, 1000, 2))
+    subset = benchmark(large_rating_scale.subset_grades, grades)
+    assert len(subset) == 500
+
+
+def test_large_rating_scale_add_rating_grades(
+    benchmark, large_rating_scale: RatingScale
+) -> None:
+    """Benchmark adding 100 grades to a 1,000 grade rating scale."""
+    new_grades = {i: float(i) * 0.01 for i in range(1000, 1100)}
+    expanded = benchmark(large_rating_scale.add_rating_grades, new_grades)
+    assert len(expanded) == 1100
@@ -0,0 +1,46 @@
+"""Instruction count benchmarks for credit_risk_rating.rating._mappings.
+
+Tests marked with ``pytest.mark.benchmark`` are measured by ``pytest-codspeed``
+when run with ``pytest --codspeed --codspeed-mode=instrumentation``.
+Instrumentation counts the instructions executed instead of timing them, so
+small regressions are visible regardless of runner noise. Without
+``--codspeed`` the tests run once as ordinary tests.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from credit_risk_rating.rating.system._mappings import Metadata, RatingScale
+
+_METADATA_DATA = {f"key_{i}": i for i in range(100)}
+
+
+@pytest.mark.benchmark
+def test_bench_metadata_construction() -> None:
+    """Benchmark validating and building metadata with 100 fields."""
+    metadata = Metadata(_METADATA_DATA)
+    assert len(metadata) == 100
+
+
+@pytest.mark.benchmark
+def test_bench_metadata_subset(large_metadata: Metadata) -> None:
+    """Benchmark subsetting 10 fields from metadata with 100 fields."""
+    subset = large_metadata.subset_metadata([f"key_{i}" for i in range(0, 100, 10)])
+    assert len(subset) == 10
+
+
+@pytest.mark.benchmark
+def test_bench_rating_scale_construction(
+    large_rating_scale_data: dict[int, float],
+) -> None:
+    """Benchmark validating and building a 1,000 grade rating scale."""
+    rating_scale = RatingScale(large_rating_scale_data)
+    assert len(rating_scale) == 1000
+
+
+@pytest.mark.benchmark
+def test_bench_rating_scale_subset_grades(large_rating_scale: RatingScale) -> None:
+    """Benchmark subsetting half of the grades of a 1,000 grade rating scale."""
+    subset = large_rating_scale.subset_grades(list(range(0, 1000, 2)))
+    assert len(subset) == 500
@@ -13,19 +13,37 @@ from credit_risk_rating.exceptions import MetadataError, RatingScaleError
 from credit_risk_rating.rating.system._mappings import Metadata, RatingScale
 
 
+def _assert_tuple_equal(actual, expected, ordered: bool = True) -> None:
+    """Assert `actual` is a tuple holding the elements of `expected`.
+
+    When `ordered` is False elements are compared after sorting by their
+    ``repr``, which also handles mixed str and int grades.
+    """
+    assert type(actual) is tuple
+    if ordered:
+        assert actual == tuple(expected)
+    else:
+        assert sorted(actual, key=repr) == sorted(expected, key=repr)
+
+
 class TestBaseImmutableMapping:
     """Test suite for common behavior across RatingScale and Metadata."""
 
-    @pytest.mark.parametrize(
-        "mapping_class,sample_data",
-        [
+    @pytest.fixture(
+        params=[
             (RatingScale, {1: 0.01, 2: 0.02, 3: 0.05}),
-            (Metadata, {"model_version": "v2.1", "institution": "ABC"}),
+            (Metadata, {"a": "x", "b": "y", "c": "z"}),
         ],
+        ids=["rating", "metadata"],
     )
-    def test_immutability_after_init(self, mapping_class, sample_data) -> None:
+    def mapping_case(self, request: pytest.FixtureRequest) -> tuple:
+        """Fixture providing a mapping class, sample data and an instance of it."""
+        mapping_class, sample_data = request.param
+        return mapping_class, sample_data, mapping_class(sample_data)
+
+    def test_immutability_after_init(self, mapping_case) -> None:
         """Test that objects become immutable after initialization."""
-        instance = mapping_class(sample_data)
+        _, _, instance = mapping_case
 
         with pytest.raises(AttributeError, match="immutable"):
             instance.new_attr = "value"
@@ -33,19 +51,15 @@ class TestBaseImmutableMapping:
         with pytest.raises(AttributeError, match="immutable"):
             instance._data = {}
 
-    @pytest.mark.parametrize(
-        "mapping_class,sample_data",
-        [
-            (RatingScale, {1: 0.01, 2: 0.02}),
-            (Metadata, {"key1": "value1", "key2": "value2"}),
-        ],
-    )
-    def test_dictionary_like_access(self, mapping_class, sample_data) -> None:
+        with pytest.raises(AttributeError, match="immutable"):
+            del instance._data
+
+    def test_dictionary_like_access(self, mapping_case) -> None:
         """Test dictionary-like access patterns."""
-        instance = mapping_class(sample_data)
+        _, sample_data, instance = mapping_case
 
         # Test __getitem__
-        first_key = list(sample_data.keys())[0]
+        first_key = next(iter(sample_data))
         assert instance[first_key] == sample_data[first_key]
 
         # Test __contains__
@@ -56,18 +70,11 @@ class TestBaseImmutableMapping:
         assert len(instance) == len(sample_data)
 
         # Test __iter__
-        assert set(instance) == set(sample_data.keys())
+        assert list(instance) == list(sample_data)
 
-    @pytest.mark.parametrize(
-        "mapping_class,sample_data",
-        [
-            (RatingScale, {1: 0.01, 2: 0.02}),
-            (Metadata, {"key1": "value1", "key2": "value2"}),
-        ],
-    )
-    def test_equality_and_repr(self, mapping_class, sample_data) -> None:
+    def test_equality_and_repr(self, mapping_case) -> None:
         """Test equality comparison and string representation."""
-        instance1 = mapping_class(sample_data)
+        mapping_class, sample_data, instance1 = mapping_case
         instance2 = mapping_class(sample_data.copy())
         instance3 = mapping_class({})
 
@@ -81,33 +88,25 @@ class TestBaseImmutableMapping:
         assert mapping_class.__name__ in repr_str
         assert str(sample_data) in repr_str
 
-    @pytest.mark.parametrize(
-        "mapping_class,sample_data",
-        [
-            (RatingScale, {1: 0.01, 2: 0.02, 3: 0.05}),
-            (Metadata, {"a": 1, "b": 2, "c": 3}),
-        ],
-    )
-    def test_keys_values_items(self, mapping_class, sample_data) -> None:
+    def test_keys_values_items(self, mapping_case) -> None:
         """Test keys(), values(), and items() methods."""
-        instance = mapping_class(sample_data)
+        _, sample_data, instance = mapping_case
 
         # Test keys
         keys = instance.keys()
-        assert isinstance(keys, list)
-        assert set(keys) == set(sample_data.keys())
+        _assert_tuple_equal(keys, sample_data)
 
         # Test values
         values = instance.values()
-        assert isinstance(values, list)
-        assert set(values) == set(sample_data.values())
+        _assert_tuple_equal(values, sample_data.values())
 
         # Test items
         items = instance.items()
-        assert isinstance(items, list)
-        assert set(items) == set(sample_data.items())
+        _assert_tuple_equal(items, sample_data.items())
 
-    @pytest.mark.parametrize("mapping_class", [RatingScale, Metadata])
+    @pytest.mark.parametrize(
+        "mapping_class", [RatingScale, Metadata], ids=["rating_scale", "metadata"]
+    )
     def test_empty_initialization(self, mapping_class) -> None:
         """Test initialization with no data."""
         instance = mapping_class()
@@ -116,42 +115,56 @@ class TestBaseImmutableMapping:
         assert list(instance.values()) == []
         assert list(instance.items()) == []
 
-    @pytest.mark.parametrize("mapping_class", [RatingScale, Metadata])
+    @pytest.mark.parametrize(
+        "mapping_class", [RatingScale, Metadata], ids=["rating_scale", "metadata"]
+    )
     def test_none_initialization(self, mapping_class) -> None:
         """Test initialization with None."""
         instance = mapping_class(None)
         assert len(instance) == 0
 
     @pytest.mark.parametrize(
-        "mapping_class,sample_data",
-        [
-            (RatingScale, {1: 0.01, 2: 0.02}),
-            (Metadata, {"key1": "value1", "key2": "value2"}),
-        ],
+        "mapping_class, pairs",
+        [(RatingScale, [("A", 0.01), ("B", 0.05)]), (Metadata, [("key1", "value1")])],
+        ids=["rating_scale", "metadata"],
     )
-    def test_to_dict(self, mapping_class, sample_data) -> None:
+    def test_key_value_pairs_initialization(self, mapping_class, pairs) -> None:
+        """Test initialization with a list of key-value pairs."""
+        instance = mapping_class(pairs)
+        assert instance == mapping_class(dict(pairs))
+
+    def test_to_dict(self, mapping_case) -> None:
         """Test to_dict() method."""
-        instance = mapping_class(sample_data)
+        _, sample_data, instance = mapping_case
         result = instance.to_dict()
 
         assert result == sample_data
-        assert result is not instance._data  # Different object
+        assert type(result) is dict
+        assert result is not instance.to_dict()  # New copy per call
 
         # Modifying returned dict shouldn't affect original
         if sample_data:
-            first_key = list(sample_data.keys())[0]
+            first_key = next(iter(sample_data))
             result[first_key] = "modified"
             assert instance[first_key] == sample_data[first_key]
 
-    @pytest.mark.parametrize(
-        "mapping_class,sample_data",
-        [
-            (RatingScale, {1: 0.01, 2: 0.02}),
-            (Metadata, {"key1": "value1", "key2": "value2"}),
-        ],
-    )
-    def test_from_dict_classmethod(self, mapping_class, sample_data) -> None:
+    def test_as_view(self, mapping_case) -> None:
+        """Test as_view() returns a shared read-only view of the data."""
+        _, sample_data, instance = mapping_case
+        view = instance.as_view()
+
+        assert view == sample_data
+        assert view is instance.as_view()  # No copy per call
+
+        # View is read-only
+        first_key = next(iter(sample_data))
+        with pytest.raises(TypeError):
+            view[first_key] = "modified"
+
+    def test_from_dict_classmethod(self, mapping_case) -> None:
         """Test from_dict class method."""
+        mapping_class, sample_data, _ = mapping_case
+
         # With data
         instance = mapping_class.from_dict(sample_data)
         assert instance.to_dict() == sample_data
@@ -168,6 +181,16 @@ class TestBaseImmutableMapping:
 class TestRatingScale:
     """Test suite for RatingScale class."""
 
+    @pytest.fixture
+    def rating_2(self) -> RatingScale:
+        """Fixture providing a two grade rating scale."""
+        return RatingScale({1: 0.01, 2: 0.02})
+
+    @pytest.fixture
+    def rating_3(self) -> RatingScale:
+        """Fixture providing a three grade rating scale."""
+        return RatingScale({1: 0.01, 2: 0.02, 3: 0.05})
+
     def test_valid_initialization(self) -> None:
         """Test valid initialization patterns."""
         # Integer grades with float values
@@ -186,32 +209,30 @@ class TestRatingScale:
         assert rating_map[1] == 0.01
         assert rating_map["A"] == 0.10
 
-    def test_invalid_grade_types(self) -> None:
+    @pytest.mark.parametrize(
+        "bad_input",
+        [{1.5: 0.01}, {None: 0.01}, {(1, 2): 0.01}],
+        ids=["float", "none", "tuple"],
+    )
+    def test_invalid_grade_types(self, bad_input) -> None:
         """Test that invalid grade types raise TypeError."""
         with pytest.raises(TypeError, match="Rating grades must be 'str' or 'int'"):
-            RatingScale({1.5: 0.01})  # float grade
-
-        with pytest.raises(TypeError, match="Rating grades must be 'str' or 'int'"):
-            RatingScale({None: 0.01})  # None grade
-
-        with pytest.raises(TypeError, match="Rating grades must be 'str' or 'int'"):
-            RatingScale({[1, 2]: 0.01})  # list grade
+            RatingScale(bad_input)
 
-    def test_invalid_value_types(self) -> None:
+    @pytest.mark.parametrize(
+        "bad_input",
+        [
+            {1: "not_numeric"},
+            {1: 0.01, 2: None},
+            {1: 0.01, 2: [1, 2, 3]},
+            {1: 1},  # int values should also raise error according to validation
+        ],
+        ids=["str", "none", "list", "int"],
+    )
+    def test_invalid_value_types(self, bad_input) -> None:
         """Test that non-float values raise TypeError."""
         with pytest.raises(TypeError, match="must be numeric"):
-            RatingScale({1: "not_numeric"})
-
-        with pytest.raises(TypeError, match="must be numeric"):
-            RatingScale({1: 0.01, 2: None})
-
-        with pytest.raises(TypeError, match="must be numeric"):
-            RatingScale({1: 0.01, 2: [1, 2, 3]})
-
-        with pytest.raises(TypeError, match="must be numeric"):
-            RatingScale(
-                {1: 1}
-            )  # int values should also raise error according to validation
+            RatingScale(bad_input)
 
     def test_float_values_only(self) -> None:
         """Test that only float values are accepted."""
@@ -221,49 +242,56 @@ class TestRatingScale:
         assert rating_map[2] == 2.5
         assert rating_map[3] == 0.0
 
-    def test_rating_scale_property(self) -> None:
-        """Test the rating_scale property."""
-        original_data = {1: 0.01, 2: 0.02}
-        rating_map = RatingScale(original_data)
+    def test_from_json_bytes(self, rating_2: RatingScale) -> None:
+        """Test decoding a RatingScale directly from JSON bytes."""
+        pytest.importorskip("msgspec")
+
+        decoded = RatingScale.from_json_bytes(rating_2.to_json(), grade_type=int)
+        assert decoded == rating_2
+
+        decoded = RatingScale.from_json_bytes(b'{"A": 0.10, "B": 0.20}')
+        assert decoded == RatingScale({"A": 0.10, "B": 0.20})
 
+        with pytest.raises(TypeError, match="must be numeric"):
+            RatingScale.from_json_bytes(b'{"A": "not_numeric"}')
+
+        with pytest.raises(ValueError, match="grade_type"):
+            RatingScale.from_json_bytes(b"{}", grade_type=float)
+
+    def test_rating_scale_property(self, rating_2: RatingScale) -> None:
+        """Test the rating_scale property."""
         # Should return a copy
-        scale = rating_map.rating_scale
-        assert scale == original_data
-        assert scale is not rating_map._data  # Different object
+        scale = rating_2.rating_scale
+        assert scale == {1: 0.01, 2: 0.02}
+        assert type(scale) is dict
+        assert scale is not rating_2.rating_scale  # New copy per call
 
         # Modifying returned dict shouldn't affect original
         scale[3] = 0.03
-        assert 3 not in rating_map
+        assert 3 not in rating_2
 
     def test_rating_grades_method(self) -> None:
         """Test rating_grades() method."""
         rating_map = RatingScale({3: 0.05, 1: 0.01, 2: 0.02})
         grades = rating_map.rating_grades()
 
-        assert isinstance(grades, list)
-        assert set(grades) == {1, 2, 3}
+        _assert_tuple_equal(grades, [1, 2, 3], ordered=False)
 
-    def test_rating_values_method(self) -> None:
+    def test_rating_values_method(self, rating_3: RatingScale) -> None:
         """Test rating_values() method."""
-        rating_map = RatingScale({1: 0.01, 2: 0.02, 3: 0.05})
-        values = rating_map.rating_values()
+        values = rating_3.rating_values()
 
-        assert isinstance(values, list)
-        assert set(values) == {0.01, 0.02, 0.05}
+        _assert_tuple_equal(values, (0.01, 0.02, 0.05))
 
-    def test_rating_grade_value_pairs_method(self) -> None:
+    def test_rating_grade_value_pairs_method(self, rating_2: RatingScale) -> None:
         """Test rating_grade_value_pairs() method."""
-        rating_map = RatingScale({1: 0.01, 2: 0.02})
-        pairs = rating_map.rating_grade_value_pairs()
+        pairs = rating_2.rating_grade_value_pairs()
 
-        assert isinstance(pairs, list)
-        assert set(pairs) == {(1, 0.01), (2, 0.02)}
+        _assert_tuple_equal(pairs, ((1, 0.01), (2, 0.02)))
 
-    def test_subset_grades_single_grade(self) -> None:
+    def test_subset_grades_single_grade(self, rating_3: RatingScale) -> None:
         """Test subset_grades with single grade."""
-        rating_map = RatingScale({1: 0.01, 2: 0.02, 3: 0.05})
-
-        subset = rating_map.subset_grades(2)
+        subset = rating_3.subset_grades(2)
         assert len(subset) == 1
         assert subset[2] == 0.02
         assert isinstance(subset, RatingScale)
@@ -278,13 +306,19 @@ class TestRatingScale:
         assert subset[3] == 0.05
         assert 2 not in subset
 
-    def test_subset_grades_missing_grade(self) -> None:
-        """Test subset_grades with missing grades."""
-        rating_map = RatingScale({1: 0.01, 2: 0.02})
+    @pytest.mark.parametrize("grade", [1.0, True], ids=["float", "bool"])
+    def test_subset_grades_keeps_stored_grades(self, rating_2, grade) -> None:
+        """Test that subset_grades uses the stored grades for equal requests."""
+        subset = rating_2.subset_grades([grade, 2])
+
+        assert subset == RatingScale({1: 0.01, 2: 0.02})
+        assert [type(key) for key in subset.rating_grades()] == [int, int]
 
+    def test_subset_grades_missing_grade(self, rating_2: RatingScale) -> None:
+        """Test subset_grades with missing grades."""
         # Single missing grade
         with pytest.raises(RatingScaleError) as exc_info:
-            rating_map.subset_grades(3)
+            rating_2.subset_grades(3)
 
         error = exc_info.value
         assert "Rating grades not found: [3]" in str(error)
@@ -293,66 +327,56 @@ class TestRatingScale:
 
         # Multiple missing grades
         with pytest.raises(RatingScaleError) as exc_info:
-            rating_map.subset_grades([1, 3, 4])  # 1 exists, 3,4 don't
+            rating_2.subset_grades([1, 3, 4])  # 1 exists, 3,4 don't
 
         error = exc_info.value
         assert "[3, 4]" in str(error)
         assert error.rating == 3  # First missing grade
 
-    def test_subset_grades_all_missing(self) -> None:
+    def test_subset_grades_all_missing(self, rating_2: RatingScale) -> None:
         """Test subset_grades when all requested grades are missing."""
-        rating_map = RatingScale({1: 0.01, 2: 0.02})
-
         with pytest.raises(RatingScaleError) as exc_info:
-            rating_map.subset_grades([5, 6])
+            rating_2.subset_grades([5, 6])
 
         error = exc_info.value
         assert "[5, 6]" in str(error)
         assert error.rating == 5
 
-    def test_add_rating_grades(self) -> None:
+    def test_add_rating_grades(self, rating_2: RatingScale) -> None:
         """Test add_rating_grades method."""
-        rating_map = RatingScale({1: 0.01, 2: 0.02})
-
         # Add new grades
-        expanded = rating_map.add_rating_grades({3: 0.05, 4: 0.10})
+        expanded = rating_2.add_rating_grades({3: 0.05, 4: 0.10})
         assert len(expanded) == 4
         assert expanded[1] == 0.01  # Original data preserved
         assert expanded[3] == 0.05  # New data added
         assert isinstance(expanded, RatingScale)
 
         # Original unchanged
-        assert len(rating_map) == 2
+        assert len(rating_2) == 2
 
-    def test_add_rating_grades_override(self) -> None:
+    def test_add_rating_grades_override(self, rating_2: RatingScale) -> None:
         """Test add_rating_grades with overlapping grades."""
-        rating_map = RatingScale({1: 0.01, 2: 0.02})
-
         # Override existing grade
-        expanded = rating_map.add_rating_grades({1: 0.015, 3: 0.05})
+        expanded = rating_2.add_rating_grades({1: 0.015, 3: 0.05})
         assert len(expanded) == 3
         assert expanded[1] == 0.015  # Overridden value
         assert expanded[2] == 0.02  # Original value
         assert expanded[3] == 0.05  # New value
 
-    def test_add_rating_grades_empty(self) -> None:
+    def test_add_rating_grades_empty(self, rating_2: RatingScale) -> None:
         """Test add_rating_grades with empty dict."""
-        rating_map = RatingScale({1: 0.01, 2: 0.02})
-
-        expanded = rating_map.add_rating_grades({})
+        expanded = rating_2.add_rating_grades({})
         assert len(expanded) == 2
-        assert expanded.rating_scale == rating_map.rating_scale
+        assert expanded.rating_scale == rating_2.rating_scale
 
-    def test_add_rating_grades_validation(self) -> None:
+    def test_add_rating_grades_validation(self, rating_2: RatingScale) -> None:
         """Test that add_rating_grades validates new data."""
-        rating_map = RatingScale({1: 0.01, 2: 0.02})
-
         # Should validate new grades and values
         with pytest.raises(TypeError):
-            rating_map.add_rating_grades({1.5: 0.03})  # Invalid grade type
+            rating_2.add_rating_grades({1.5: 0.03})  # Invalid grade type
 
         with pytest.raises(TypeError):
-            rating_map.add_rating_grades({3: "invalid"})  # Invalid value type
+            rating_2.add_rating_grades({3: "invalid"})  # Invalid value type
 
     def test_get_grade_value(self) -> None:
         """Test get_grade_value method."""
@@ -374,20 +398,23 @@ class TestRatingScale:
         assert rating_map.has_grade(99) is False
         assert rating_map.has_grade("Z") is False
 
-    def test_key_error_access(self) -> None:
+    def test_key_error_access(self, rating_2: RatingScale) -> None:
         """Test KeyError when accessing non-existent grades."""
-        rating_map = RatingScale({1: 0.01, 2: 0.02})
-
         with pytest.raises(KeyError):
-            _ = rating_map[99]
+            _ = rating_2[99]
 
         with pytest.raises(KeyError):
-            _ = rating_map["nonexistent"]
+            _ = rating_2["nonexistent"]
 
 
 class TestMetadata:
     """Test suite for Metadata class."""
 
+    @pytest.fixture
+    def metadata_2(self) -> Metadata:
+        """Fixture providing two item metadata."""
+        return Metadata({"key1": "value1", "key2": "value2"})
+
     def test_valid_initialization(self) -> None:
         """Test valid initialization patterns."""
         # Valid Python identifiers
@@ -420,68 +447,54 @@ class TestMetadata:
         assert metadata["model_version"] == "v2.1"
         assert metadata["institution"] == "ABC Bank"
 
-    def test_invalid_key_types(self) -> None:
+    @pytest.mark.parametrize(
+        "bad_key", [123, None, ("tuple",)], ids=["int", "none", "tuple"]
+    )
+    def test_invalid_key_types(self, bad_key) -> None:
         """Test that non-string keys raise MetadataError."""
         with pytest.raises(MetadataError, match="must be string"):
-            Metadata({123: "value"})
-
-        with pytest.raises(MetadataError, match="must be string"):
-            Metadata({None: "value"})
+            Metadata({bad_key: "value"})
 
-        with pytest.raises(MetadataError, match="must be string"):
-            Metadata({["list"]: "value"})
-
-    def test_invalid_identifier_keys(self) -> None:
+    @pytest.mark.parametrize(
+        "bad_key",
+        ["123invalid", "invalid-key", "invalid key", "if"],
+        ids=["leading_digit", "hyphen", "space", "keyword"],
+    )
+    def test_invalid_identifier_keys(self, bad_key) -> None:
         """Test that invalid Python identifiers raise MetadataError."""
         with pytest.raises(MetadataError, match="not a valid Python identifier"):
-            Metadata({"123invalid": "value"})
-
-        with pytest.raises(MetadataError, match="not a valid Python identifier"):
-            Metadata({"invalid-key": "value"})
-
-        with pytest.raises(MetadataError, match="not a valid Python identifier"):
-            Metadata({"invalid key": "value"})  # Space
-
-        with pytest.raises(MetadataError, match="not a valid Python identifier"):
-            Metadata({"if": "value"})  # Python keyword
+            Metadata({bad_key: "value"})
 
-    def test_metadata_property(self) -> None:
+    def test_metadata_property(self, metadata_2: Metadata) -> None:
         """Test the metadata property."""
-        original_data = {"key1": "value1", "key2": "value2"}
-        metadata = Metadata(original_data)
-
         # Should return a copy
-        meta_dict = metadata.metadata
-        assert meta_dict == original_data
-        assert meta_dict is not metadata._data  # Different object
+        meta_dict = metadata_2.metadata
+        assert meta_dict == {"key1": "value1", "key2": "value2"}
+        assert type(meta_dict) is dict
+        assert meta_dict is not metadata_2.metadata  # New copy per call
 
         # Modifying returned dict shouldn't affect original
         meta_dict["key3"] = "value3"
-        assert "key3" not in metadata
+        assert "key3" not in metadata_2
 
     def test_metadata_items_method(self) -> None:
         """Test metadata_items() method."""
         metadata = Metadata({"c": 3, "a": 1, "b": 2})
         items = metadata.metadata_items()
 
-        assert isinstance(items, list)
-        assert set(items) == {"a", "b", "c"}
+        _assert_tuple_equal(items, ["a", "b", "c"], ordered=False)
 
-    def test_metadata_values_method(self) -> None:
+    def test_metadata_values_method(self, metadata_2: Metadata) -> None:
         """Test metadata_values() method."""
-        metadata = Metadata({"key1": "value1", "key2": "value2"})
-        values = metadata.metadata_values()
+        values = metadata_2.metadata_values()
 
-        assert isinstance(values, list)
-        assert set(values) == {"value1", "value2"}
+        _assert_tuple_equal(values, ("value1", "value2"))
 
-    def test_metadata_item_value_pairs_method(self) -> None:
+    def test_metadata_item_value_pairs_method(self, metadata_2: Metadata) -> None:
         """Test metadata_item_value_pairs() method."""
-        metadata = Metadata({"key1": "value1", "key2": "value2"})
-        pairs = metadata.metadata_item_value_pairs()
+        pairs = metadata_2.metadata_item_value_pairs()
 
-        assert isinstance(pairs, list)
-        assert set(pairs) == {("key1", "value1"), ("key2", "value2")}
+        _assert_tuple_equal(pairs, (("key1", "value1"), ("key2", "value2")))
 
     def test_subset_metadata_single_item(self) -> None:
         """Test subset_metadata with single item."""
@@ -512,13 +525,22 @@ class TestMetadata:
         assert subset["score"] == 0.85
         assert "institution" not in subset
 
-    def test_subset_metadata_missing_item(self) -> None:
-        """Test subset_metadata with missing items."""
-        metadata = Metadata({"key1": "value1", "key2": "value2"})
+    def test_subset_metadata_keeps_stored_items(self, metadata_2) -> None:
+        """Test that subset_metadata uses the stored items for equal requests."""
 
+        class MetadataItem(str):
+            __slots__ = ()
+
+        subset = metadata_2.subset_metadata([MetadataItem("key1")])
+
+        assert [type(key) for key in subset.metadata_items()] == [str]
+        assert subset.key1 == "value1"
+
+    def test_subset_metadata_missing_item(self, metadata_2: Metadata) -> None:
+        """Test subset_metadata with missing items."""
         # Single missing item
         with pytest.raises(MetadataError) as exc_info:
-            metadata.subset_metadata("missing")
+            metadata_2.subset_metadata("missing")
 
         error = exc_info.value
         assert "Keys not found in metadata: ['missing']" in str(error)
@@ -526,18 +548,16 @@ class TestMetadata:
 
         # Multiple missing items
         with pytest.raises(MetadataError) as exc_info:
-            metadata.subset_metadata(["key1", "missing1", "missing2"])
+            metadata_2.subset_metadata(["key1", "missing1", "missing2"])
 
         error = exc_info.value
         assert "['missing1', 'missing2']" in str(error)
         assert error.key == "missing1"  # First missing key
 
-    def test_add_metadata(self) -> None:
+    def test_add_metadata(self, metadata_2: Metadata) -> None:
         """Test add_metadata method."""
-        metadata = Metadata({"key1": "value1", "key2": "value2"})
-
         # Add new metadata
-        expanded = metadata.add_metadata({"key3": "value3", "key4": "value4"})
+        expanded = metadata_2.add_metadata({"key3": "value3", "key4": "value4"})
         assert len(expanded) == 4
         assert expanded["key1"] == "value1"  # Original data preserved
         assert expanded["key3"] == "value3"  # New data added
@@ -545,27 +565,23 @@ class TestMetadata:
         assert isinstance(expanded, Metadata)
 
         # Original unchanged
-        assert len(metadata) == 2
+        assert len(metadata_2) == 2
 
-    def test_add_metadata_override(self) -> None:
+    def test_add_metadata_override(self, metadata_2: Metadata) -> None:
         """Test add_metadata with overlapping keys."""
-        metadata = Metadata({"key1": "value1", "key2": "value2"})
-
         # Override existing key
-        expanded = metadata.add_metadata({"key1": "new_value", "key3": "value3"})
+        expanded = metadata_2.add_metadata({"key1": "new_value", "key3": "value3"})
         assert len(expanded) == 3
         assert expanded["key1"] == "new_value"  # Overridden value
         assert expanded["key2"] == "value2"  # Original value
         assert expanded["key3"] == "value3"  # New value
         assert expanded.key1 == "new_value"  # Attribute access updated
 
-    def test_add_metadata_empty(self) -> None:
+    def test_add_metadata_empty(self, metadata_2: Metadata) -> None:
         """Test add_metadata with empty dict."""
-        metadata = Metadata({"key1": "value1", "key2": "value2"})
-
-        expanded = metadata.add_metadata({})
+        expanded = metadata_2.add_metadata({})
         assert len(expanded) == 2
-        assert expanded.metadata == metadata.metadata
+        assert expanded.metadata == metadata_2.metadata
 
     def test_add_metadata_validation(self) -> None:
         """Test that add_metadata validates new data."""
@@ -677,6 +693,7 @@ class TestEdgeCases:
 
         assert len(large_rating_map) == 1000
         assert large_rating_map[500] == 5.0
+        assert list(large_rating_map.keys()) == list(range(1000))
 
         # Large metadata
         large_metadata_data = {f"key_{i}": f"value_{i}" for i in range(100)}
@@ -798,20 +815,20 @@ class TestMethodCoverage:
 
         # Test direct iteration
         keys_from_iter = [key for key in rating_map]
-        assert set(keys_from_iter) == {1, 2, 3}
+        assert keys_from_iter == [1, 2, 3]
 
         # Test with builtin functions
-        assert list(rating_map) == rating_map.keys()
+        assert tuple(rating_map) == rating_map.keys()
         assert len(list(rating_map)) == 3
 
         metadata = Metadata({"a": 1, "b": 2, "c": 3})
 
         # Test direct iteration
         keys_from_iter = [key for key in metadata]
-        assert set(keys_from_iter) == {"a", "b", "c"}
+        assert keys_from_iter == ["a", "b", "c"]
 
         # Test that iteration order is consistent with keys()
-        assert list(metadata) == metadata.keys()
+        assert tuple(metadata) == metadata.keys()
 
     def test_contains_operator_coverage(self) -> None:
         """Test __contains__ operator thoroughly."""
@@ -861,6 +878,25 @@ class TestMethodCoverage:
         assert metadata1 != metadata3
         assert metadata1 != rating_map1
 
+    def test_hash_consistency(self) -> None:
+        """Test that equal mappings hash equally and can be used in sets."""
+        rating_map1 = RatingScale({1: 0.01, 2: 0.02})
+        rating_map2 = RatingScale({1: 0.01, 2: 0.02})
+        rating_map3 = RatingScale({1: 0.01, 2: 0.03})
+
+        assert hash(rating_map1) == hash(rating_map2)
+        assert hash(rating_map1) == hash(rating_map1)  # Cached hash is stable
+        assert len({rating_map1, rating_map2, rating_map3}) == 2
+
+        # Hashes are cached, so comparisons after hashing still work
+        assert rating_map1 == rating_map2
+        assert rating_map1 != rating_map3
+
+        # Metadata with unhashable values cannot be hashed
+        metadata = Metadata({"list_val": [1, 2, 3]})
+        with pytest.raises(TypeError):
+            hash(metadata)
+
 
 class TestIntegrationScenarios:
     """Test suite for realistic integration scenarios."""
@@ -0,0 +1,313 @@
+"""Tests for credit_risk_rating.rating.system._one_dimensional module.
+
+This module contains tests for the OneDimensionalRatingSystem class, covering
+construction, lookups, serialization and the classes built by its factory.
+"""
+
+from __future__ import annotations
+
+import pickle  # noqa: S403
+
+import pytest
+
+from credit_risk_rating.exceptions import RatingValidationError
+from credit_risk_rating.rating.system import _base
+from credit_risk_rating.rating.system._one_dimensional import (
+    OneDimensionalRatingSystem,
+)
+
+
+@pytest.fixture
+def system() -> OneDimensionalRatingSystem:
+    """Fixture providing a rating system with ascending rating values."""
+    return OneDimensionalRatingSystem(
+        rating_scale={"A": 0.01, "B": 0.05, "C": 0.10},
+        metadata={"institution": "ABC Bank"},
+    )
+
+
+class TestConstruction:
+    """Test suite for building rating systems from rating scale dictionaries."""
+
+    @pytest.mark.parametrize(
+        "first, second",
+        [({"A": 0.0}, {"A": -0.0}), ({1: 0.01}, {True: 0.01})],
+        ids=["signed_zero", "bool_grade"],
+    )
+    def test_equal_scales_keep_their_own_items(self, first, second) -> None:
+        """Test that equal rating scales of different types are not merged."""
+        first_system = OneDimensionalRatingSystem(rating_scale=first)
+        second_system = OneDimensionalRatingSystem(rating_scale=second)
+
+        assert repr(first_system.rating_scale.to_dict()) == repr(first)
+        assert repr(second_system.rating_scale.to_dict()) == repr(second)
+
+
+class TestToDict:
+    """Test suite for exporting rating systems to dictionaries."""
+
+    def test_to_dict_keys_in_order(self, system) -> None:
+        """Test that to_dict lists the type, scale, metadata and config."""
+        assert list(system.to_dict()) == [
+            "rating_system_type",
+            "rating_scale",
+            "metadata",
+            "config",
+        ]
+
+    def test_to_dict_returns_independent_copies(self, system) -> None:
+        """Test that modifying an exported dictionary leaves later exports intact."""
+        data = system.to_dict()
+        data["rating_scale"]["D"] = 0.5
+        data["metadata"]["institution"] = "Other Bank"
+        data["config"]["required_grades"] = ("Z",)
+
+        assert system.to_dict() == {
+            "rating_system_type": "OneDimensionalRatingSystem",
+            "rating_scale": {"A": 0.01, "B": 0.05, "C": 0.10},
+            "metadata": {"institution": "ABC Bank"},
+            "config": {},
+        }
+
+    def test_exported_config_is_not_shared_between_instances(self) -> None:
+        """Test that each export holds its own copy of the class configuration."""
+        custom_class = OneDimensionalRatingSystem.create_custom_class(
+            "ExportTestSystem", {"required_grades": ["A", "B"]}
+        )
+        first = custom_class(rating_scale={"A": 0.01, "B": 0.05})
+        second = custom_class(rating_scale={"A": 0.02, "B": 0.06})
+
+        first.to_dict()["config"]["required_grades"] = ("Z",)
+
+        assert second.to_dict()["config"]["required_grades"] == ("A", "B")
+        assert custom_class.get_config()["required_grades"] == ("A", "B")
+
+
+class TestImmutability:
+    """Test suite for the immutability of rating systems."""
+
+    @pytest.mark.parametrize(
+        "name, value",
+        [
+            ("metadata", {"institution": "Other Bank"}),
+            ("rating_scale", {"A": 0.5}),
+            ("new_attr", "value"),
+        ],
+        ids=["metadata", "rating_scale", "new_attr"],
+    )
+    def test_assigning_attributes_raises(self, system, name, value) -> None:
+        """Test that attributes cannot be assigned after construction."""
+        with pytest.raises(AttributeError, match="immutable"):
+            setattr(system, name, value)
+
+    def test_deleting_attributes_raises(self, system) -> None:
+        """Test that attributes cannot be deleted after construction."""
+        with pytest.raises(AttributeError, match="immutable"):
+            del system.metadata
+
+    def test_cached_values_match_data(self, system) -> None:
+        """Test that cached exports and hashes stay consistent with the data."""
+        json_str = system.to_json()
+        hash_value = hash(system)
+        with pytest.raises(AttributeError):
+            system.metadata = {"institution": "Other Bank"}
+
+        assert system.to_json() == json_str
+        assert '"institution": "ABC Bank"' in json_str
+        assert hash(system) == hash_value
+
+    def test_pickle_round_trip(self, system) -> None:
+        """Test that pickling reconstructs an equal rating system."""
+        restored = pickle.loads(pickle.dumps(system))  # noqa: S301
+        assert restored == system
+        assert restored.to_dict() == system.to_dict()
+
+
+class TestRatingPosition:
+    """Test suite for looking up the position of rating grades."""
+
+    def test_positions_follow_scale_order(self, system) -> None:
+        """Test that each grade maps to its zero-indexed position."""
+        assert [system.get_rating_position(grade) for grade in "ABC"] == [0, 1, 2]
+
+    def test_unknown_grade_raises(self, system) -> None:
+        """Test that grades outside the scale raise ValueError."""
+        system.get_rating_position("A")
+        with pytest.raises(ValueError, match="not found in rating scale"):
+            system.get_rating_position("Z")
+
+
+class TestPositionByValue:
+    """Test suite for mapping values onto an ascending rating scale."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [(0.0, 0), (0.01, 0), (0.03, 1), (0.05, 1), (0.10, 2)],
+    )
+    def test_first_rating_at_least_value(self, system, value, expected) -> None:
+        """Test that values map to the first rating that is not smaller."""
+        assert system.get_position_by_value(value) == expected
+
+    def test_value_above_scale_raises(self, system) -> None:
+        """Test that values above the largest rating value raise ValueError."""
+        with pytest.raises(ValueError, match="greater than the largest"):
+            system.get_position_by_value(0.2)
+
+    def test_descending_values_raise_on_every_call(self) -> None:
+        """Test that unordered scales keep raising after the first lookup."""
+        system = OneDimensionalRatingSystem(rating_scale={"A": 0.05, "B": 0.01})
+        for _ in range(2):
+            with pytest.raises(ValueError, match="ascending order"):
+                system.get_position_by_value(0.03)
+
+
+class TestArrayLookups:
+    """Test suite for validating and valuing many ratings at once."""
+
+    def test_is_valid_ratings(self, system) -> None:
+        """Test that each rating is checked against the scale."""
+        np = pytest.importorskip("numpy")
+        result = system.is_valid_ratings(np.array(["A", "Z", "C"]))
+        assert result.dtype == np.bool_
+        assert result.tolist() == [True, False, True]
+
+    def test_get_rating_values(self, system) -> None:
+        """Test that each rating is replaced by its value."""
+        np = pytest.importorskip("numpy")
+        result = system.get_rating_values(iter(["C", "A", "C"]))
+        assert result.dtype == np.float64
+        assert result.tolist() == [0.10, 0.01, 0.10]
+
+    def test_empty_input(self, system) -> None:
+        """Test that no ratings produce empty arrays."""
+        pytest.importorskip("numpy")
+        assert system.is_valid_ratings([]).tolist() == []
+        assert system.get_rating_values([]).tolist() == []
+
+    def test_get_rating_values_unknown_grade_raises(self, system) -> None:
+        """Test that grades outside the scale raise KeyError."""
+        pytest.importorskip("numpy")
+        with pytest.raises(KeyError):
+            system.get_rating_values(["A", "Z"])
+
+    @pytest.mark.parametrize("method", ["is_valid_ratings", "get_rating_values"])
+    def test_missing_numpy_raises(self, system, monkeypatch, method) -> None:
+        """Test that an informative error is raised without numpy."""
+        monkeypatch.setattr(_base, "np", None)
+        with pytest.raises(ImportError, match="pip install numpy"):
+            getattr(system, method)(["A"])
+
+
+class TestEquality:
+    """Test suite for comparing and hashing rating systems."""
+
+    def test_equal_systems(self, system) -> None:
+        """Test that systems with equal data are equal and hash alike."""
+        other = OneDimensionalRatingSystem(
+            rating_scale={"A": 0.01, "B": 0.05, "C": 0.10},
+            metadata={"institution": "ABC Bank"},
+        )
+        assert other == system
+        assert hash(other) == hash(system)
+        assert len({system, other}) == 1
+
+    @pytest.mark.parametrize(
+        "rating_scale, metadata",
+        [
+            ({"A": 0.01, "B": 0.05, "C": 0.20}, {"institution": "ABC Bank"}),
+            ({"A": 0.01, "B": 0.05, "C": 0.10}, {"institution": "Other Bank"}),
+        ],
+        ids=["rating_scale", "metadata"],
+    )
+    def test_different_data(self, system, rating_scale, metadata) -> None:
+        """Test that systems with different data are not equal."""
+        other = OneDimensionalRatingSystem(rating_scale=rating_scale, metadata=metadata)
+        assert other != system
+
+    def test_different_class(self, system) -> None:
+        """Test that systems of different classes are not equal."""
+        custom_class = OneDimensionalRatingSystem.create_custom_class(
+            "EqualityTestSystem", {"required_grades": ["A", "B", "C"]}
+        )
+        other = custom_class(
+            rating_scale={"A": 0.01, "B": 0.05, "C": 0.10},
+            metadata={"institution": "ABC Bank"},
+        )
+        assert other != system
+        assert system.__eq__(system.to_dict()) is NotImplemented
+
+    def test_unhashable_metadata_raises(self) -> None:
+        """Test that metadata with unhashable values cannot be hashed."""
+        system = OneDimensionalRatingSystem(
+            rating_scale={"A": 0.01}, metadata={"owners": ["risk"]}
+        )
+        for _ in range(2):
+            with pytest.raises(TypeError):
+                hash(system)
+
+
+class TestValueLookupTable:
+    """Test suite for the position and value lookup tables."""
+
+    def test_tables_match_scale(self, system) -> None:
+        """Test that positions index into the matching rating values."""
+        pytest.importorskip("numpy")
+        positions, values = system.value_lookup_table()
+        assert dict(positions) == {"A": 0, "B": 1, "C": 2}
+        assert values[[positions["C"], positions["A"]]].tolist() == [0.10, 0.01]
+
+    def test_tables_are_read_only(self, system) -> None:
+        """Test that neither lookup table can be modified."""
+        pytest.importorskip("numpy")
+        positions, values = system.value_lookup_table()
+        with pytest.raises(TypeError):
+            positions["D"] = 3
+        with pytest.raises(ValueError, match="read-only"):
+            values[0] = 1.0
+        assert system.get_rating_position("A") == 0
+        assert system.value_lookup_table()[1].tolist() == [0.01, 0.05, 0.10]
+
+    def test_values_array_is_cached(self, system) -> None:
+        """Test that repeated calls reuse the same value array."""
+        pytest.importorskip("numpy")
+        assert system.value_lookup_table()[1] is system.value_lookup_table()[1]
+
+    def test_missing_numpy_raises(self, system, monkeypatch) -> None:
+        """Test that an informative error is raised without numpy."""
+        monkeypatch.setattr(_base, "np", None)
+        with pytest.raises(ImportError, match="pip install numpy"):
+            system.value_lookup_table()
+
+
+class TestRequiredGrades:
+    """Test suite for checking ratings against the class configuration."""
+
+    @pytest.fixture
+    def custom_class(self) -> type[OneDimensionalRatingSystem]:
+        """Fixture providing a class that requires grades A and B."""
+        return OneDimensionalRatingSystem.create_custom_class(
+            "RequiredGradesTestSystem", {"required_grades": ["A", "B"]}
+        )
+
+    def test_is_required_grade(self, custom_class) -> None:
+        """Test that only the configured grades are required."""
+        assert custom_class.is_required_grade("A")
+        assert not custom_class.is_required_grade("C")
+        assert custom_class.get_config()["required_grades"] == ("A", "B")
+
+    def test_class_without_required_grades(self) -> None:
+        """Test that no grade is required by the unconfigured class."""
+        assert not OneDimensionalRatingSystem.is_required_grade("A")
+
+    def test_subclasses_do_not_share_required_grades(self, custom_class) -> None:
+        """Test that each class checks its own required grades."""
+        other_class = OneDimensionalRatingSystem.create_custom_class(
+            "OtherRequiredGradesTestSystem", {"required_grades": ["X"]}
+        )
+        assert other_class.is_required_grade("X")
+        assert not custom_class.is_required_grade("X")
+
+    def test_missing_required_grade_raises(self, custom_class) -> None:
+        """Test that rating scales must contain every required grade."""
+        with pytest.raises(RatingValidationError):
+            custom_class(rating_scale={"A": 0.01, "C": 0.05})
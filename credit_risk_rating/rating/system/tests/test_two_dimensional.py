@@ -0,0 +1,249 @@
+"""Tests for credit_risk_rating.rating.system._two_dimensional module.
+
+This module contains tests for the PDLGDRatingSystem class, covering
+construction, lookups, serialization and the bulk array based methods.
+"""
+
+from __future__ import annotations
+
+import json
+import pickle  # noqa: S403
+
+import pytest
+
+from credit_risk_rating.exceptions import RatingValidationError
+from credit_risk_rating.rating.system import _base
+from credit_risk_rating.rating.system._two_dimensional import PDLGDRatingSystem
+
+
+@pytest.fixture
+def system() -> PDLGDRatingSystem:
+    """Fixture providing a PD/LGD rating system."""
+    return PDLGDRatingSystem(
+        pd_rating_scale={1: 0.001, 2: 0.005},
+        lgd_rating_scale={"A": 0.10, "B": 0.25},
+        metadata={"institution": "ABC Bank"},
+    )
+
+
+class TestToDict:
+    """Test suite for exporting rating systems to dictionaries."""
+
+    def test_to_dict_keys_in_order(self, system) -> None:
+        """Test that to_dict lists the type, scales, metadata and config."""
+        assert list(system.to_dict()) == [
+            "rating_system_type",
+            "pd_rating_scale",
+            "lgd_rating_scale",
+            "metadata",
+            "config",
+        ]
+
+    def test_to_dict_returns_independent_copies(self, system) -> None:
+        """Test that modifying an exported dictionary leaves later exports intact."""
+        data = system.to_dict()
+        data["pd_rating_scale"][3] = 0.5
+        data["lgd_rating_scale"]["C"] = 0.5
+        data["metadata"]["institution"] = "Other Bank"
+        data["config"]["name"] = "Changed"
+
+        assert system.to_dict() == {
+            "rating_system_type": "PDLGDRatingSystem",
+            "pd_rating_scale": {1: 0.001, 2: 0.005},
+            "lgd_rating_scale": {"A": 0.10, "B": 0.25},
+            "metadata": {"institution": "ABC Bank"},
+            "config": {},
+        }
+
+
+class TestFromDict:
+    """Test suite for creating rating systems from dictionaries."""
+
+    @pytest.fixture
+    def custom_class(self) -> type[PDLGDRatingSystem]:
+        """Fixture providing a PD/LGD class with grade and metadata requirements."""
+        return PDLGDRatingSystem.create_custom_class(
+            "FromDictTestSystem",
+            {
+                "required_grade_dimensions": {"pd": [1, 2], "lgd": ["A", "B"]},
+                "required_metadata": ["institution"],
+            },
+        )
+
+    def test_round_trip(self, custom_class) -> None:
+        """Test that to_dict output is reconstructed into an equal system."""
+        system = custom_class(
+            pd_rating_scale={1: 0.01, 2: 0.05},
+            lgd_rating_scale={"A": 0.10, "B": 0.25},
+            metadata={"institution": "ABC Bank"},
+        )
+        restored = custom_class.from_dict(system.to_dict())
+        assert restored.to_dict() == system.to_dict()
+
+    def test_json_round_trip_validates_grades(self, custom_class) -> None:
+        """Test that grades turned into strings by JSON fail validation."""
+        system = custom_class(
+            pd_rating_scale={1: 0.01, 2: 0.05},
+            lgd_rating_scale={"A": 0.10, "B": 0.25},
+            metadata={"institution": "ABC Bank"},
+        )
+        with pytest.raises(RatingValidationError):
+            custom_class.from_dict(json.loads(system.to_json()))
+
+    def test_own_export_with_invalid_contents_raises(self, custom_class) -> None:
+        """Test that dictionaries naming the class are still fully validated."""
+        data = custom_class(
+            pd_rating_scale={1: 0.01, 2: 0.05},
+            lgd_rating_scale={"A": 0.10, "B": 0.25},
+            metadata={"institution": "ABC Bank"},
+        ).to_dict()
+        data["metadata"] = {}
+        with pytest.raises(RatingValidationError, match="metadata"):
+            custom_class.from_dict(data)
+
+        data["metadata"] = {"institution": "ABC Bank"}
+        data["pd_rating_scale"] = {7: 0.3}
+        with pytest.raises(RatingValidationError):
+            custom_class.from_dict(data)
+
+
+class TestImmutability:
+    """Test suite for the immutability of rating systems."""
+
+    @pytest.mark.parametrize(
+        "name", ["metadata", "pd_rating_scale", "lgd_rating_scale"]
+    )
+    def test_assigning_attributes_raises(self, system, name) -> None:
+        """Test that attributes cannot be assigned after construction."""
+        with pytest.raises(AttributeError, match="immutable"):
+            setattr(system, name, {})
+
+    def test_cached_values_match_data(self, system) -> None:
+        """Test that cached grade checks and exports stay consistent."""
+        json_str = system.to_json()
+        with pytest.raises(AttributeError):
+            system.pd_rating_scale = {7: 0.3}
+
+        assert system.is_valid_pd_rating(1)
+        assert not system.is_valid_pd_rating(7)
+        assert system.to_json() == json_str
+
+    def test_pickle_round_trip(self, system) -> None:
+        """Test that pickling reconstructs the same rating scales and metadata."""
+        restored = pickle.loads(pickle.dumps(system))  # noqa: S301
+        assert type(restored) is PDLGDRatingSystem
+        assert restored.to_dict() == system.to_dict()
+
+
+class TestExpectedLossBatch:
+    """Test suite for computing expected losses of many exposures."""
+
+    def test_matches_single_expected_loss(self, system) -> None:
+        """Test that each result equals the scalar expected loss."""
+        pytest.importorskip("numpy")
+        pd_ratings, lgd_ratings, ead = [1, 2, 2], ["A", "B", "A"], [1e6, 5e5, 2e5]
+        result = system.get_expected_loss_batch(pd_ratings, lgd_ratings, ead)
+        assert result.tolist() == [
+            system.get_expected_loss(*exposure)
+            for exposure in zip(pd_ratings, lgd_ratings, ead)
+        ]
+
+    def test_shared_ead(self, system) -> None:
+        """Test that a scalar EAD applies to every exposure."""
+        np = pytest.importorskip("numpy")
+        result = system.get_expected_loss_batch(
+            np.array([1, 2]), np.array(["A", "B"]), 1000
+        )
+        np.testing.assert_allclose(result, [0.1, 1.25])
+
+    def test_different_lengths_raise(self, system) -> None:
+        """Test that PD and LGD ratings must have the same length."""
+        pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="same number of PD and LGD"):
+            system.get_expected_loss_batch([1, 2], ["A"])
+
+    def test_ead_generator(self, system) -> None:
+        """Test that EAD values may be given by any iterable."""
+        np = pytest.importorskip("numpy")
+        result = system.get_expected_loss_batch(
+            [1, 2], ["A", "B"], (ead for ead in [1000, 2000])
+        )
+        np.testing.assert_allclose(result, [0.1, 2.5])
+
+    @pytest.mark.parametrize("ead", [[1000], [1000, 2000, 3000]], ids=["one", "three"])
+    def test_ead_different_length_raises(self, system, ead) -> None:
+        """Test that one EAD value is required per exposure."""
+        pytest.importorskip("numpy")
+        with pytest.raises(ValueError, match="same number of PD ratings and EAD"):
+            system.get_expected_loss_batch([1, 2], ["A", "B"], ead)
+
+    @pytest.mark.parametrize(
+        "pd_ratings, lgd_ratings",
+        [([1, 3], ["A", "B"]), ([1, 2], ["A", "Z"])],
+        ids=["pd", "lgd"],
+    )
+    def test_unknown_grade_raises(self, system, pd_ratings, lgd_ratings) -> None:
+        """Test that grades outside either scale raise KeyError."""
+        pytest.importorskip("numpy")
+        with pytest.raises(KeyError):
+            system.get_expected_loss_batch(pd_ratings, lgd_ratings)
+
+    def test_missing_numpy_raises(self, system, monkeypatch) -> None:
+        """Test that an informative error is raised without numpy."""
+        monkeypatch.setattr(_base, "np", None)
+        with pytest.raises(ImportError, match="pip install numpy"):
+            system.get_expected_loss_batch([1], ["A"])
+
+
+class TestValidateRatingsBatch:
+    """Test suite for checking many PD and LGD ratings at once."""
+
+    def test_ratings_checked_against_own_scale(self, system) -> None:
+        """Test that PD and LGD ratings are checked against their own scales."""
+        np = pytest.importorskip("numpy")
+        pd_valid, lgd_valid = system.validate_ratings_batch([1, "A", 3], ["A", 1])
+        assert pd_valid.dtype == np.bool_
+        assert pd_valid.tolist() == [True, False, False]
+        assert lgd_valid.tolist() == [True, False]
+
+    def test_mixed_grade_types(self) -> None:
+        """Test that scales mixing integer and string grades are supported."""
+        pytest.importorskip("numpy")
+        system = PDLGDRatingSystem(
+            pd_rating_scale={1: 0.001, "D": 1.0}, lgd_rating_scale={"A": 0.10}
+        )
+        pd_valid, _ = system.validate_ratings_batch(["D", 1, 2], [])
+        assert pd_valid.tolist() == [True, True, False]
+
+    def test_missing_numpy_raises(self, system, monkeypatch) -> None:
+        """Test that an informative error is raised without numpy."""
+        monkeypatch.setattr(_base, "np", None)
+        with pytest.raises(ImportError, match="pip install numpy"):
+            system.validate_ratings_batch([1], ["A"])
+
+
+class TestValueArrays:
+    """Test suite for the read-only PD and LGD value arrays."""
+
+    @pytest.mark.parametrize(
+        "name, expected",
+        [
+            ("pd_rating_values_array", [0.001, 0.005]),
+            ("lgd_rating_values_array", [0.10, 0.25]),
+        ],
+        ids=["pd", "lgd"],
+    )
+    def test_arrays_are_cached_and_read_only(self, system, name, expected) -> None:
+        """Test that the arrays match the scale and cannot be modified."""
+        pytest.importorskip("numpy")
+        values = getattr(system, name)
+        assert values.tolist() == expected
+        assert getattr(system, name) is values
+        with pytest.raises(ValueError, match="read-only"):
+            values[0] = 1.0
+
+    def test_missing_numpy_raises(self, system, monkeypatch) -> None:
+        """Test that an informative error is raised without numpy."""
+        monkeypatch.setattr(_base, "np", None)
+        with pytest.raises(ImportError, match="pip install numpy"):
+            system.pd_rating_values_array  # noqa: B018
@@ -7,6 +7,8 @@ initialization, and behavior.
 
 from __future__ import annotations
 
+import pickle  # noqa: S403
+
 import pytest
 
 from credit_risk_rating.exceptions import (
@@ -17,90 +19,9 @@ from credit_risk_rating.exceptions import (
 )
 
 
-class BaseExceptionTest:
-    """Base test class with common exception testing patterns.
-
-    This class provides common test methods that can be inherited by
-    specific exception test classes to avoid code duplication.
-    """
-
-    # Subclasses should override these
-    exception_class = None
-    expected_base_class = None
-
-    def test_inheritance(self) -> None:
-        """Test that exception inherits from expected base class."""
-        assert issubclass(self.exception_class, self.expected_base_class)
-
-    def test_basic_initialization(self) -> None:
-        """Test basic initialization with message only."""
-        message = "Test error message"
-        error = self.exception_class(message)
-
-        # Handle KeyError's string representation quirk
-        if issubclass(self.exception_class, KeyError):
-            assert str(error) == f"'{message}'"
-        else:
-            assert str(error) == message
-
-        assert isinstance(error, self.expected_base_class)
-        assert isinstance(error, self.exception_class)
-
-    def test_initialization_with_args(self) -> None:
-        """Test initialization with additional arguments."""
-        message = "Test error"
-        extra_arg = "additional context"
-        error = self.exception_class(message, extra_arg)
-
-        # All exceptions should include extra args in string representation
-        assert extra_arg in str(error)
-
-    def test_raise_and_catch(self) -> None:
-        """Test raising and catching the exception."""
-        message = "Test exception"
-
-        with pytest.raises(self.exception_class) as exc_info:
-            raise self.exception_class(message)
-
-        assert isinstance(exc_info.value, self.expected_base_class)
-        assert isinstance(exc_info.value, self.exception_class)
-
-    def test_exception_in_inheritance_chain(self) -> None:
-        """Test that exception can be caught as base Exception types."""
-        error = self.exception_class("test")
-
-        # Should be catchable as expected base class
-        try:
-            raise error
-        except self.expected_base_class:
-            pass  # Expected
-        else:
-            pytest.fail(
-                f"Should have been caught as {self.expected_base_class.__name__}"
-            )
-
-        # Should be catchable as Exception
-        try:
-            raise error
-        except Exception:
-            pass  # Expected
-        else:
-            pytest.fail("Should have been caught as Exception")
-
-
-class TestRatingScaleInputError(BaseExceptionTest):
-    """Test suite for RatingScaleInputError exception."""
-
-    exception_class = RatingScaleInputError
-    expected_base_class = ValueError
-
-
-class TestRatingValidationError(BaseExceptionTest):
+class TestRatingValidationError:
     """Test suite for RatingValidationError exception."""
 
-    exception_class = RatingValidationError
-    expected_base_class = ValueError
-
     def test_initialization_with_rating(self) -> None:
         """Test initialization with rating parameter."""
         message = "Invalid rating value"
@@ -160,12 +81,9 @@ class TestRatingValidationError(BaseExceptionTest):
         assert error.value == value
 
 
-class TestRatingScaleError(BaseExceptionTest):
+class TestRatingScaleError:
     """Test suite for RatingScaleError exception."""
 
-    exception_class = RatingScaleError
-    expected_base_class = KeyError
-
     def test_initialization_with_rating(self) -> None:
         """Test initialization with rating parameter."""
         message = "Rating not found in scale"
@@ -173,7 +91,7 @@ class TestRatingScaleError(BaseExceptionTest):
         error = RatingScaleError(message, rating=rating)
 
         assert error.rating == rating
-        assert error.available_ratings == []
+        assert error.available_ratings == ()
 
     def test_initialization_with_available_ratings(self) -> None:
         """Test initialization with available_ratings parameter."""
@@ -182,7 +100,7 @@ class TestRatingScaleError(BaseExceptionTest):
         error = RatingScaleError(message, available_ratings=available_ratings)
 
         assert error.rating is None
-        assert error.available_ratings == available_ratings
+        assert error.available_ratings == tuple(available_ratings)
 
     def test_initialization_with_all_parameters(self) -> None:
         """Test initialization with all optional parameters."""
@@ -195,12 +113,20 @@ class TestRatingScaleError(BaseExceptionTest):
         )
 
         assert error.rating == rating
-        assert error.available_ratings == available_ratings
-
-    def test_available_ratings_defaults_to_empty_list(self) -> None:
-        """Test that available_ratings defaults to empty list when None passed."""
+        assert error.available_ratings == tuple(available_ratings)
+
+    def test_available_ratings_stored_as_tuple(self) -> None:
+        """Test that available_ratings is frozen and tuples are not copied."""
+        ratings = ("A", "B")
+        error = RatingScaleError("test", available_ratings=ratings)
+        assert error.available_ratings is ratings
+        error = RatingScaleError("test", available_ratings=["A"])
+        assert error.available_ratings == ("A",)
+
+    def test_available_ratings_defaults_to_empty_tuple(self) -> None:
+        """Test that available_ratings defaults to empty tuple when None passed."""
         error = RatingScaleError("test", available_ratings=None)
-        assert error.available_ratings == []
+        assert error.available_ratings == ()
 
     def test_raise_and_catch_with_context(self) -> None:
         """Test raising and catching with contextual information."""
@@ -215,15 +141,12 @@ class TestRatingScaleError(BaseExceptionTest):
 
         error = exc_info.value
         assert error.rating == rating
-        assert error.available_ratings == available_ratings
+        assert error.available_ratings == tuple(available_ratings)
 
 
-class TestMetadataError(BaseExceptionTest):
+class TestMetadataError:
     """Test suite for MetadataError exception."""
 
-    exception_class = MetadataError
-    expected_base_class = ValueError
-
     def test_initialization_with_key(self) -> None:
         """Test initialization with key parameter."""
         message = "Invalid metadata key"
@@ -301,6 +224,12 @@ class TestExceptionModule:
         (RatingScaleError, KeyError, "Rating not found"),
         (MetadataError, ValueError, "Metadata error"),
     ],
+    ids=[
+        "RatingScaleInputError",
+        "RatingValidationError",
+        "RatingScaleError",
+        "MetadataError",
+    ],
 )
 class TestCommonExceptionBehavior:
     """Parametrized tests for behavior common to all exceptions."""
@@ -314,9 +243,26 @@ class TestCommonExceptionBehavior:
     ) -> None:
         """Test basic instantiation for all exception classes."""
         error = exception_class(sample_message)
+
+        # Handle KeyError's string representation quirk
+        if issubclass(exception_class, KeyError):
+            assert str(error) == f"'{sample_message}'"
+        else:
+            assert str(error) == sample_message
+
         assert isinstance(error, base_class)
         assert isinstance(error, exception_class)
 
+    def test_initialization_with_args(
+        self, exception_class, base_class, sample_message
+    ) -> None:
+        """Test initialization with additional arguments."""
+        extra_arg = "additional context"
+        error = exception_class(sample_message, extra_arg)
+
+        # All exceptions should include extra args in string representation
+        assert extra_arg in str(error)
+
     def test_raise_and_catch_generic(
         self, exception_class, base_class, sample_message
     ) -> None:
@@ -327,6 +273,28 @@ class TestCommonExceptionBehavior:
         with pytest.raises(base_class):
             raise exception_class(sample_message)
 
+    def test_exception_in_inheritance_chain(
+        self, exception_class, base_class, sample_message
+    ) -> None:
+        """Test that exception can be caught as base Exception types."""
+        error = exception_class(sample_message)
+
+        # Should be catchable as expected base class
+        try:
+            raise error
+        except base_class:
+            pass  # Expected
+        else:
+            pytest.fail(f"Should have been caught as {base_class.__name__}")
+
+        # Should be catchable as Exception
+        try:
+            raise error
+        except Exception:
+            pass  # Expected
+        else:
+            pytest.fail("Should have been caught as Exception")
+
 
 # Fixtures for complex exception instances
 @pytest.fixture
@@ -365,7 +333,7 @@ class TestExceptionFixtures:
         error = sample_rating_map_error
         assert isinstance(error, RatingScaleError)
         assert error.rating == "X"
-        assert error.available_ratings == ["A", "B", "C"]
+        assert error.available_ratings == ("A", "B", "C")
 
     def test_metadata_error_fixture(self, sample_metadata_error) -> None:
         """Test the MetadataError fixture."""
@@ -418,3 +386,20 @@ class TestExceptionEdgeCases:
         except RatingScaleInputError as e:
             assert e.__cause__ is not None
             assert isinstance(e.__cause__, ValueError)
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            RatingValidationError("Invalid PD", rating=5, value=1.2),
+            RatingScaleError("Not found", rating="X", available_ratings=["A", "B"]),
+            MetadataError("Invalid key", key="bad-key"),
+        ],
+        ids=["validation", "scale", "metadata"],
+    )
+    def test_pickle_round_trip_keeps_context(self, error) -> None:
+        """Test that pickling preserves the contextual attributes."""
+        restored = pickle.loads(pickle.dumps(error))  # noqa: S301
+        assert type(restored) is type(error)
+        assert str(restored) == str(error)
+        for name in ("rating", "value", "available_ratings", "key"):
+            assert getattr(restored, name, None) == getattr(error, name, None)